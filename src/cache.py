@@ -0,0 +1,22 @@
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    logger.warning("diskcache not available - persistent caches are disabled")
+
+
+def open_cache(config, name, **settings):
+    if not DISKCACHE_AVAILABLE:
+        return None
+
+    try:
+        return diskcache.Cache(os.path.join(config.CACHE_DIR, name), **settings)
+    except Exception as e:
+        logger.warning(f"Could not open {name} cache: {e}")
+        return None
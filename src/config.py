@@ -1,19 +1,49 @@
 import os
+import json
 import logging
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+_TWITTER_OAUTH_KEYS = ('api_key', 'api_secret', 'access_token', 'access_token_secret')
+
+
+def _load_twitter_credentials(raw):
+    # a bad pool setting should only cost the extra twitter credentials, not app startup
+    try:
+        entries = json.loads(raw or '[]')
+    except json.JSONDecodeError as e:
+        logger.warning(f"Ignoring TWITTER_CREDENTIALS, not valid JSON: {e}")
+        return []
+    
+    if not isinstance(entries, list):
+        logger.warning("Ignoring TWITTER_CREDENTIALS, expected a JSON list")
+        return []
+    
+    credentials = []
+    for index, entry in enumerate(entries):
+        if isinstance(entry, dict) and (entry.get('bearer_token') or all(entry.get(key) for key in _TWITTER_OAUTH_KEYS)):
+            credentials.append(entry)
+        else:
+            logger.warning(f"Ignoring TWITTER_CREDENTIALS entry {index}: needs bearer_token or {', '.join(_TWITTER_OAUTH_KEYS)}")
+    return credentials
+
+
 class Config:
     def __init__(self):
         self.DATABASE_PATH = os.getenv('DATABASE_PATH', './sift.db')
         self.LOG_LEVEL = getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper())
         self.LOG_FILE = os.getenv('LOG_FILE', './logs/sift.log')
         
+        self.TWITTER_BEARER_TOKEN = os.getenv('TWITTER_BEARER_TOKEN', '')
         self.TWITTER_API_KEY = os.getenv('TWITTER_API_KEY', '')
         self.TWITTER_API_SECRET = os.getenv('TWITTER_API_SECRET', '')
         self.TWITTER_ACCESS_TOKEN = os.getenv('TWITTER_ACCESS_TOKEN', '')
         self.TWITTER_ACCESS_TOKEN_SECRET = os.getenv('TWITTER_ACCESS_TOKEN_SECRET', '')
+        # optional pool: JSON list of {"bearer_token"} or {"api_key", "api_secret", "access_token", "access_token_secret"}
+        self.TWITTER_CREDENTIALS = _load_twitter_credentials(os.getenv('TWITTER_CREDENTIALS', ''))
         
         self.REDDIT_CLIENT_ID = os.getenv('REDDIT_CLIENT_ID', '')
         self.REDDIT_CLIENT_SECRET = os.getenv('REDDIT_CLIENT_SECRET', '')
@@ -30,11 +60,21 @@ class Config:
         self.MAX_CORRELATION_DISTANCE_KM = float(os.getenv('MAX_CORRELATION_DISTANCE_KM', 50))
         self.CORRELATION_TIME_WINDOW_HOURS = int(os.getenv('CORRELATION_TIME_WINDOW_HOURS', 24))
         self.MAX_OSINT_RESULTS = int(os.getenv('MAX_OSINT_RESULTS', 1000))
+        self.FORENSIC_PARSE_WORKERS = int(os.getenv('FORENSIC_PARSE_WORKERS') or os.cpu_count() or 1)
+        self.BACKGROUND_TASK_WORKERS = int(os.getenv('BACKGROUND_TASK_WORKERS', 2))
+
+        self.CACHE_DIR = os.getenv('CACHE_DIR', './.cache')
+        self.GEOCODE_CACHE_TTL_HOURS = int(os.getenv('GEOCODE_CACHE_TTL_HOURS', 48))
+        self.WEB_INTEL_CACHE_TTL_HOURS = int(os.getenv('WEB_INTEL_CACHE_TTL_HOURS', 24))
+        self.OSINT_CACHE_TTL_HOURS = float(os.getenv('OSINT_CACHE_TTL_HOURS', 1))
+        self.WEB_PAGE_CACHE_TTL_DAYS = int(os.getenv('WEB_PAGE_CACHE_TTL_DAYS', 7))
+        self.VIEW_CACHE_TTL_HOURS = int(os.getenv('VIEW_CACHE_TTL_HOURS', 24))
 
         self.OLLAMA_HOST = os.getenv('OLLAMA_HOST', 'http://localhost:11434')
         self.OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', 'gemma:4b')
         self.OLLAMA_TIMEOUT = int(os.getenv('OLLAMA_TIMEOUT', 120))
         self.OLLAMA_ENABLE = os.getenv('OLLAMA_ENABLE', 'True').lower() == 'true'
+        self.OLLAMA_KEEP_ALIVE = os.getenv('OLLAMA_KEEP_ALIVE', '30m')
 
         self.WEB_SEARCH_ENABLE = os.getenv('WEB_SEARCH_ENABLE', 'True').lower() == 'true'
         self.WEB_SEARCH_ENGINE = os.getenv('WEB_SEARCH_ENGINE', 'google')
@@ -42,10 +82,14 @@ class Config:
         self.WEB_SEARCH_TIMEOUT = int(os.getenv('WEB_SEARCH_TIMEOUT', 45))
         self.WEB_SCRAPE_TIMEOUT = int(os.getenv('WEB_SCRAPE_TIMEOUT', 20))
         self.WEB_SCRAPE_MAX_PAGES = int(os.getenv('WEB_SCRAPE_MAX_PAGES', 15))
+        self.WEB_SCRAPE_CONCURRENCY = int(os.getenv('WEB_SCRAPE_CONCURRENCY', 20))
+        self.WEB_SCRAPE_PER_HOST = int(os.getenv('WEB_SCRAPE_PER_HOST', 4))
+        self.WEB_SCRAPE_MAX_BYTES = int(os.getenv('WEB_SCRAPE_MAX_BYTES', 1048576))
 
         self.GOOGLE_SEARCH_ENGINE_ID = os.getenv('GOOGLE_SEARCH_ENGINE_ID', '')
         self.GOOGLE_SEARCH_API_KEY = os.getenv('GOOGLE_SEARCH_API_KEY', '')
         self.SERPAPI_KEY = os.getenv('SERPAPI_KEY', '')
+        self.BRAVE_SEARCH_API_KEY = os.getenv('BRAVE_SEARCH_API_KEY', '')
 
         self.SEARCH_DEPTH = os.getenv('SEARCH_DEPTH', 'deep')
         self.SEARCH_STRATEGY = os.getenv('SEARCH_STRATEGY', 'multi_engine')
@@ -58,9 +102,14 @@ class Config:
 
         self.BROWSER_HEADLESS = os.getenv('BROWSER_HEADLESS', 'True').lower() == 'true'
         self.BROWSER_TIMEOUT = int(os.getenv('BROWSER_TIMEOUT', 30))
+        self.BROWSER_POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', 2))
         self.BROWSER_USER_AGENT = os.getenv('BROWSER_USER_AGENT', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
 
         self.LLM_MAX_TOKENS = int(os.getenv('LLM_MAX_TOKENS', 4096))
+        self.LLM_JSON_MAX_TOKENS = int(os.getenv('LLM_JSON_MAX_TOKENS', 512))
+        self.LLM_QUERY_MAX_TOKENS = int(os.getenv('LLM_QUERY_MAX_TOKENS', 384))
+        self.LLM_SUMMARY_MAX_TOKENS = int(os.getenv('LLM_SUMMARY_MAX_TOKENS', 2048))
+        self.LLM_WEB_BATCH_SIZE = int(os.getenv('LLM_WEB_BATCH_SIZE', 4))
         self.LLM_TEMPERATURE = float(os.getenv('LLM_TEMPERATURE', 0.3))
         self.LLM_CONTEXT_WINDOW = int(os.getenv('LLM_CONTEXT_WINDOW', 8192))
 
@@ -20,6 +20,9 @@ class CorrelationEngine:
         
         logger.info(f"Correlating {len(forensic_events)} forensic events with {len(osint_data)} OSINT items")
         
+        if self.llm_client and forensic_events and osint_data:
+            self.llm_client.warm_up('correlation')
+        
         for forensic_event in forensic_events:
             event_correlations = self._find_temporal_correlations(
                 forensic_event, osint_data, location
@@ -120,7 +123,7 @@ class CorrelationEngine:
                 if llm_analysis and 'correlation_score' in llm_analysis:
                     llm_score = llm_analysis['correlation_score'] / 10.0
 
-                    if 'llm_analysis' not in osint_item:
+                    if osint_item.get('llm_analysis') is None:
                         osint_item['llm_analysis'] = llm_analysis
 
                     traditional_score = self._calculate_traditional_relevance(forensic_event, osint_item)
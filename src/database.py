@@ -1,17 +1,21 @@
 import sqlite3
 import json
 import logging
+import threading
 from contextlib import contextmanager
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 class DatabaseManager:
     def __init__(self, db_path):
         self.db_path = db_path
+        self._local = threading.local()
         self._initialize_database()
     
     def _initialize_database(self):
         with self.get_connection() as conn:
+            conn.execute('PRAGMA journal_mode = WAL')
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -95,19 +99,58 @@ class DatabaseManager:
                 ON correlations(correlation_strength)
             ''')
             
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_forensic_investigation_timestamp 
+                ON forensic_events(investigation_id, timestamp)
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_osint_investigation_timestamp 
+                ON osint_data(investigation_id, timestamp)
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_correlations_investigation_strength 
+                ON correlations(investigation_id, correlation_strength DESC)
+            ''')
+            
             conn.commit()
             logger.info("Database initialized successfully")
     
-    @contextmanager
-    def get_connection(self):
-        conn = sqlite3.connect(self.db_path)
+    def _configure_connection(self, conn):
         conn.row_factory = sqlite3.Row
         conn.execute('PRAGMA foreign_keys = ON')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute('PRAGMA mmap_size = 268435456')
+        conn.execute('PRAGMA cache_size = -65536')
+        return conn
+    
+    @contextmanager
+    def get_connection(self):
+        conn = self._configure_connection(sqlite3.connect(self.db_path))
         try:
             yield conn
         finally:
             conn.close()
     
+    @contextmanager
+    def get_read_connection(self):
+        # WAL lets these per-thread read-only connections run alongside a writer
+        conn = getattr(self._local, 'read_conn', None)
+        if conn is None:
+            conn = self._configure_connection(
+                sqlite3.connect(f'{Path(self.db_path).resolve().as_uri()}?mode=ro', uri=True, check_same_thread=False)
+            )
+            self._local.read_conn = conn
+        yield conn
+    
+    def close_read_connection(self):
+        # request threads come and go, so the web app hands their connection back at teardown
+        conn = getattr(self._local, 'read_conn', None)
+        if conn is not None:
+            self._local.read_conn = None
+            conn.close()
+    
     def create_investigation(self, name, description=None, evidence_path=None, location=None, timezone='UTC'):
         with self.get_connection() as conn:
             cursor = conn.cursor()
@@ -122,13 +165,13 @@ class DatabaseManager:
             return investigation_id
     
     def get_investigations(self):
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT * FROM investigations ORDER BY created_timestamp DESC')
             return [dict(row) for row in cursor.fetchall()]
     
     def get_investigation(self, investigation_id):
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT * FROM investigations WHERE id = ?', (investigation_id,))
             row = cursor.fetchone()
@@ -269,8 +312,69 @@ class DatabaseManager:
         
         return osint_map
     
+    def _forensic_event_from_row(self, row):
+        event = dict(row)
+        if event['metadata']:
+            event.update(json.loads(event['metadata']))
+        return event
+    
+    def _osint_item_from_row(self, row):
+        item = dict(row)
+
+        if item['coordinates_lat'] is not None and item['coordinates_lon'] is not None:
+            item['coordinates'] = {
+                'lat': item['coordinates_lat'],
+                'lon': item['coordinates_lon']
+            }
+        
+        if item['engagement_data']:
+            item['engagement'] = json.loads(item['engagement_data'])
+        
+        if item['metadata']:
+            item['data'] = json.loads(item['metadata'])
+        
+        return item
+    
+    def _iter_rows(self, query, params, batch_size=1000):
+        with self.get_read_connection() as conn:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+    
+    def iter_forensic_events(self, investigation_id):
+        rows = self._iter_rows(
+            'SELECT * FROM forensic_events WHERE investigation_id = ? ORDER BY timestamp',
+            (investigation_id,)
+        )
+        for row in rows:
+            yield self._forensic_event_from_row(row)
+    
+    def iter_osint_data(self, investigation_id):
+        rows = self._iter_rows(
+            'SELECT * FROM osint_data WHERE investigation_id = ? ORDER BY timestamp',
+            (investigation_id,)
+        )
+        for row in rows:
+            yield self._osint_item_from_row(row)
+    
+    def iter_correlations(self, investigation_id):
+        rows = self._iter_rows('''
+            SELECT c.*, fe.file_path, fe.timestamp as forensic_timestamp,
+                   od.content as osint_content, od.source as osint_source
+            FROM correlations c
+            JOIN forensic_events fe ON c.forensic_event_id = fe.id
+            JOIN osint_data od ON c.osint_data_id = od.id
+            WHERE c.investigation_id = ?
+            ORDER BY c.correlation_strength DESC
+        ''', (investigation_id,))
+        for row in rows:
+            yield dict(row)
+    
     def get_forensic_events(self, investigation_id, limit=None, start_time=None, end_time=None):
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
             
             query = 'SELECT * FROM forensic_events WHERE investigation_id = ?'
@@ -291,18 +395,23 @@ class DatabaseManager:
                 params.append(limit)
             
             cursor.execute(query, params)
-            events = []
-            
-            for row in cursor.fetchall():
-                event = dict(row)
-                if event['metadata']:
-                    event.update(json.loads(event['metadata']))
-                events.append(event)
-            
-            return events
+            return [self._forensic_event_from_row(row) for row in cursor.fetchall()]
+    
+    def get_forensic_event_counts_by_day(self, investigation_id):
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            # date() would shift offset-aware timestamps to UTC; the stored prefix is the local day
+            cursor.execute('''
+                SELECT substr(timestamp, 1, 10) AS day, COUNT(*) AS n
+                FROM forensic_events
+                WHERE investigation_id = ? AND timestamp IS NOT NULL
+                GROUP BY day
+                ORDER BY day
+            ''', (investigation_id,))
+            return [(row['day'], row['n']) for row in cursor.fetchall()]
     
     def get_osint_data(self, investigation_id, limit=None, source=None):
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
             
             query = 'SELECT * FROM osint_data WHERE investigation_id = ?'
@@ -319,78 +428,96 @@ class DatabaseManager:
                 params.append(limit)
             
             cursor.execute(query, params)
-            items = []
-            
-            for row in cursor.fetchall():
-                item = dict(row)
-
-                if item['coordinates_lat'] is not None and item['coordinates_lon'] is not None:
-                    item['coordinates'] = {
-                        'lat': item['coordinates_lat'],
-                        'lon': item['coordinates_lon']
-                    }
-                
-                if item['engagement_data']:
-                    item['engagement'] = json.loads(item['engagement_data'])
-                
-                if item['metadata']:
-                    item['data'] = json.loads(item['metadata'])
-                
-                items.append(item)
-            
-            return items
+            return [self._osint_item_from_row(row) for row in cursor.fetchall()]
     
-    def get_correlations(self, investigation_id, min_strength=0.0, limit=None):
-        with self.get_connection() as conn:
+    def get_timeline(self, investigation_id, limit=None):
+        # limit applies to each source on its own, so a long forensic history can't crowd out the osint rows
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
             
             query = '''
-                SELECT c.*, fe.file_path, fe.timestamp as forensic_timestamp,
-                       od.content as osint_content, od.source as osint_source
-                FROM correlations c
-                JOIN forensic_events fe ON c.forensic_event_id = fe.id
-                JOIN osint_data od ON c.osint_data_id = od.id
-                WHERE c.investigation_id = ? AND c.correlation_strength >= ?
-                ORDER BY c.correlation_strength DESC
+                SELECT * FROM (
+                    SELECT timestamp, 'forensic' AS kind, event_type, file_path, file_size, file_type,
+                           inode, uid, NULL AS source, NULL AS author, NULL AS content,
+                           NULL AS url, NULL AS location
+                    FROM forensic_events WHERE investigation_id = ?
+                    ORDER BY timestamp LIMIT ?
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT timestamp, 'osint', NULL, NULL, NULL, NULL,
+                           NULL, NULL, source, author, content,
+                           url, location
+                    FROM osint_data WHERE investigation_id = ?
+                    ORDER BY timestamp LIMIT ?
+                )
+                ORDER BY timestamp
             '''
             
-            params = [investigation_id, min_strength]
-            
-            if limit:
-                query += ' LIMIT ?'
-                params.append(limit)
-            
-            cursor.execute(query, params)
+            # sqlite treats a negative LIMIT as no limit
+            row_limit = limit or -1
+            cursor.execute(query, [investigation_id, row_limit, investigation_id, row_limit])
             return [dict(row) for row in cursor.fetchall()]
+
+    def get_correlations(self, investigation_id, min_strength=0.0, limit=None):
+        with self.get_read_connection() as conn:
+            return self._fetch_correlations(conn.cursor(), investigation_id, min_strength, limit)
     
-    def get_investigation_statistics(self, investigation_id):
-        with self.get_connection() as conn:
+    def _fetch_correlations(self, cursor, investigation_id, min_strength=0.0, limit=None):
+        query = '''
+            SELECT c.*, fe.file_path, fe.timestamp as forensic_timestamp,
+                   od.content as osint_content, od.source as osint_source
+            FROM correlations c
+            JOIN forensic_events fe ON c.forensic_event_id = fe.id
+            JOIN osint_data od ON c.osint_data_id = od.id
+            WHERE c.investigation_id = ? AND c.correlation_strength >= ?
+            ORDER BY c.correlation_strength DESC
+        '''
+        
+        params = [investigation_id, min_strength]
+        
+        if limit:
+            query += ' LIMIT ?'
+            params.append(limit)
+        
+        cursor.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
+    
+    def get_data_version(self, investigation_id):
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
-            
-            cursor.execute('SELECT COUNT(*) as count FROM forensic_events WHERE investigation_id = ?', 
-                          (investigation_id,))
-            forensic_count = cursor.fetchone()['count']
-            
-            cursor.execute('SELECT COUNT(*) as count FROM osint_data WHERE investigation_id = ?', 
-                          (investigation_id,))
-            osint_count = cursor.fetchone()['count']
-            
-            cursor.execute('SELECT COUNT(*) as count FROM correlations WHERE investigation_id = ?', 
-                          (investigation_id,))
-            correlation_count = cursor.fetchone()['count']
-            
             cursor.execute('''
-                SELECT AVG(correlation_strength) as avg_strength 
-                FROM correlations WHERE investigation_id = ?
-            ''', (investigation_id,))
-            avg_strength = cursor.fetchone()['avg_strength'] or 0.0
-            
-            return {
-                'forensic_events': forensic_count,
-                'osint_items': osint_count,
-                'correlations': correlation_count,
-                'avg_correlation_strength': avg_strength
-            }
+                SELECT
+                    (SELECT COUNT(*) || ':' || IFNULL(MAX(id), 0) FROM forensic_events
+                     WHERE investigation_id = ?) AS forensic_events,
+                    (SELECT COUNT(*) || ':' || IFNULL(MAX(id), 0) FROM osint_data
+                     WHERE investigation_id = ?) AS osint_data,
+                    (SELECT COUNT(*) || ':' || IFNULL(MAX(id), 0) FROM correlations
+                     WHERE investigation_id = ?) AS correlations
+            ''', (investigation_id, investigation_id, investigation_id))
+            return dict(cursor.fetchone())
+    
+    def get_investigation_statistics(self, investigation_id):
+        with self.get_read_connection() as conn:
+            return self._fetch_statistics(conn.cursor(), investigation_id)
+    
+    def _fetch_statistics(self, cursor, investigation_id):
+        cursor.execute('''
+            SELECT
+                (SELECT COUNT(*) FROM forensic_events WHERE investigation_id = :id) AS forensic_events,
+                (SELECT COUNT(*) FROM osint_data WHERE investigation_id = :id) AS osint_items,
+                COUNT(*) AS correlations,
+                IFNULL(AVG(correlation_strength), 0.0) AS avg_correlation_strength
+            FROM correlations WHERE investigation_id = :id
+        ''', {'id': investigation_id})
+        return dict(cursor.fetchone())
+    
+    def get_detail_bundle(self, investigation_id, min_strength=0.0, limit=None):
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            stats = self._fetch_statistics(cursor, investigation_id)
+            correlations = self._fetch_correlations(cursor, investigation_id, min_strength, limit)
+            return stats, correlations
     
     def delete_investigation(self, investigation_id):
         with self.get_connection() as conn:
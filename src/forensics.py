@@ -12,6 +12,10 @@ except ImportError:
     PYTSK3_AVAILABLE = False
     logger.warning("pytsk3 not available - forensic image processing will be limited")
 
+def parse_evidence_file(evidence_path, timezone_str='UTC'):
+    # entry point for the webapp's parse pool: each worker process builds its own analyzer
+    return ForensicAnalyzer().parse_evidence_file(evidence_path, timezone_str)
+
 class ForensicAnalyzer:
     def __init__(self):
         self.timeline_events = []
@@ -1,47 +1,286 @@
 import ollama
+import httpx
+import atexit
+import threading
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from string import Template
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+_WEB_CONTENT_PROMPT = Template("""Analyze the following web content for intelligence correlation potential:
+
+Context: $context
+Question: $question
+
+Web Content:
+$content
+
+Provide analysis as JSON:""")
+
+_WEB_CONTENT_BATCH_PROMPT = Template("""Analyze each of the following web documents for intelligence correlation potential:
+
+Context: $context
+Question: $question
+
+$documents
+
+Provide one analysis per document as JSON, tagging each with its document index:""")
+
+_SEARCH_QUERY_PROMPT = Template("""Generate highly targeted web search queries for forensic-OSINT correlation:
+
+FORENSIC EVIDENCE ANALYSIS:
+$forensic_context
+
+INVESTIGATION CONTEXT:
+- Location: $location
+- Timeframe: $timeframe
+
+Generate search queries prioritized by specificity and evidence correlation potential:""")
+
+_FORENSIC_SUMMARY_TMPL = Template("""Forensic Event:
+- File: $file_path
+- Event Type: $event_type
+- Timestamp: $timestamp
+- File Type: $file_type
+- Size: $file_size bytes""")
+
+_CORR_PROMPT = Template("""$forensic_summary
+
+OSINT Content:
+$osint
+
+Analyze correlation potential and return as JSON:""")
+
+_SUMMARY_PROMPT = Template("""Investigation Summary:
+
+Forensic Analysis: $forensic_summary
+
+OSINT Collection: $osint_summary
+
+Correlations: $correlations_summary
+
+Generate a comprehensive investigation summary report:""")
+
+_STRING_LIST = {'type': 'array', 'items': {'type': 'string'}}
+
+# structured output schemas, the server constrains decoding to these
+_WEB_CONTENT_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'summary': {'type': 'string'},
+        'temporal_indicators': _STRING_LIST,
+        'geographic_indicators': _STRING_LIST,
+        'security_relevance': {'type': 'number'},
+        'key_entities': _STRING_LIST,
+        'suspicious_indicators': _STRING_LIST,
+        'correlation_potential': {'type': 'number'}
+    },
+    'required': [
+        'summary', 'temporal_indicators', 'geographic_indicators', 'security_relevance',
+        'key_entities', 'suspicious_indicators', 'correlation_potential'
+    ]
+}
+
+_WEB_CONTENT_BATCH_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'analyses': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'properties': {'index': {'type': 'integer'}, **_WEB_CONTENT_SCHEMA['properties']},
+                'required': ['index'] + _WEB_CONTENT_SCHEMA['required']
+            }
+        }
+    },
+    'required': ['analyses']
+}
+
+_CORRELATION_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'correlation_score': {'type': 'number'},
+        'reasoning': {'type': 'string'},
+        'confidence': {'type': 'number'},
+        'key_connections': _STRING_LIST,
+        'recommendations': _STRING_LIST
+    },
+    'required': ['correlation_score', 'reasoning', 'confidence', 'key_connections', 'recommendations']
+}
+
+
+_shared_clients = {}
+_shared_transports = []
+_shared_clients_lock = threading.Lock()
+
+# model pulls and long generations must not be cut off, so only connecting is bounded
+_OLLAMA_HTTP_TIMEOUT = httpx.Timeout(None, connect=10.0)
+
+
+def get_shared_client(host: str) -> ollama.Client:
+    # one connection pool per ollama host, shared by the LLM client and the model manager
+    with _shared_clients_lock:
+        client = _shared_clients.get(host)
+        if client is None:
+            transport = httpx.HTTPTransport(
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            )
+            client = ollama.Client(host=host, timeout=_OLLAMA_HTTP_TIMEOUT, transport=transport)
+            _shared_clients[host] = client
+            _shared_transports.append(transport)
+        return client
+
+
+def _close_clients():
+    with _shared_clients_lock:
+        for transport in _shared_transports:
+            try:
+                transport.close()
+            except Exception:
+                pass
+        _shared_transports.clear()
+        _shared_clients.clear()
+
+
+atexit.register(_close_clients)
+
+
+def _message_content(response) -> str:
+    # newer ollama clients return pydantic objects, older ones plain dicts
+    message = getattr(response, 'message', None) or response['message']
+    content = getattr(message, 'content', None)
+    if content is None:
+        content = message['content']
+    return content
+
+def model_entries(response) -> List[Dict[str, Any]]:
+    # list() gives pydantic objects on ollama>=0.4, plain dicts before that
+    if isinstance(response, dict):
+        models = response.get('models', [])
+    elif isinstance(response, list):
+        models = response
+    else:
+        models = getattr(response, 'models', None) or []
+    return [model.model_dump() if hasattr(model, 'model_dump') else model for model in models]
+
 class OllamaClient:
+    WEB_CONTENT_SYSTEM_PROMPT = """You are an expert OSINT analyst specializing in digital forensics and intelligence correlation. 
+        Your task is to analyze web content and extract relevant information that could correlate with digital forensic evidence.
+        
+        Focus on:
+        - Temporal references (dates, times, events)
+        - Geographic references (locations, places)
+        - Security-related topics (breaches, incidents, malware)
+        - Social movements or events
+        - Technical references that might relate to computer systems
+        - Suspicious activities or anomalies
+        
+        Return your analysis as a JSON object with these fields:
+        - summary: Brief summary of the content
+        - temporal_indicators: List of time/date references found
+        - geographic_indicators: List of location references found
+        - security_relevance: Security-related topics (0-10 scale)
+        - key_entities: Important people, organizations, or systems mentioned
+        - suspicious_indicators: Any suspicious activities or anomalies
+        - correlation_potential: How likely this content is to correlate with forensic evidence (0-10 scale)
+        """
+
+    SEARCH_QUERY_SYSTEM_PROMPT = """You are an expert OSINT researcher specializing in forensic-intelligence correlation. Generate highly targeted web search queries based on forensic evidence analysis.
+
+        Create queries that would find content directly related to the forensic findings:
+        - Security incidents involving similar file types/activities
+        - Public reports of malware/attacks with matching patterns
+        - Technical analysis of similar threats or vulnerabilities
+        - News articles about cybersecurity incidents in the geographic area
+        - Social media discussions about suspicious activities
+        - Threat intelligence reports matching the indicators
+        
+        Important: 
+        - Prioritize queries that match specific forensic indicators (file names, types, locations)
+        - Include both technical security terms and plain language descriptions
+        - Consider geographic and temporal context for relevance
+        - Focus on findable, indexable content that would appear in search results
+        
+        Return only search queries, one per line, maximum 12 queries. Start with the most specific/evidence-based queries."""
+
+    CORRELATION_SYSTEM_PROMPT = """You are an expert digital forensics analyst. Analyze the correlation potential between 
+        a forensic event and OSINT content. Consider temporal, contextual, and semantic relationships.
+        
+        Rate correlation strength from 0-10 based on:
+        - Temporal proximity and relevance
+        - Content similarity and context
+        - Geographic correlation
+        - Security relevance
+        - Suspicious patterns
+        
+        Return analysis as JSON with:
+        - correlation_score: 0-10 rating
+        - reasoning: Explanation of the correlation
+        - confidence: Confidence level (0-10)
+        - key_connections: Specific connections found
+        - recommendations: Suggested follow-up actions
+        """
+
+    SUMMARY_SYSTEM_PROMPT = """You are an expert digital forensics report writer. Summarize investigation findings 
+        in a professional, clear manner suitable for law enforcement or security professionals.
+        
+        Focus on:
+        - Key correlations discovered
+        - Timeline of events
+        - Geographic patterns
+        - Security implications
+        - Recommended actions
+        
+        Write in a clear, professional tone suitable for investigators."""
+
     def __init__(self, config):
         self.config = config
         self.client = None
         self.model = config.OLLAMA_MODEL
+        self._pending_model = None
+        self._model_lock = threading.Lock()
         self.timeout = config.OLLAMA_TIMEOUT
         self.max_tokens = config.LLM_MAX_TOKENS
+        self.json_max_tokens = config.LLM_JSON_MAX_TOKENS
+        self.query_max_tokens = config.LLM_QUERY_MAX_TOKENS
+        self.summary_max_tokens = config.LLM_SUMMARY_MAX_TOKENS
+        self.web_batch_size = max(1, config.LLM_WEB_BATCH_SIZE)
         self.temperature = config.LLM_TEMPERATURE
+        self.keep_alive = config.OLLAMA_KEEP_ALIVE
+        self._system_prompts = {
+            'web_content': self.WEB_CONTENT_SYSTEM_PROMPT,
+            'search_queries': self.SEARCH_QUERY_SYSTEM_PROMPT,
+            'correlation': self.CORRELATION_SYSTEM_PROMPT,
+            'summary': self.SUMMARY_SYSTEM_PROMPT
+        }
+        self._system_messages = {
+            prompt: {'role': 'system', 'content': prompt} for prompt in self._system_prompts.values()
+        }
         
         if config.OLLAMA_ENABLE:
             self._initialize_client()
     
     def _initialize_client(self):
         try:
-            self.client = ollama.Client(host=self.config.OLLAMA_HOST)
+            self.client = get_shared_client(self.config.OLLAMA_HOST)
 
             try:
                 models_response = self.client.list()
                 available_models = []
 
-                if isinstance(models_response, dict):
-                    if 'models' in models_response:
-                        for model in models_response['models']:
-                            if isinstance(model, dict):
-                                model_name = model.get('name', model.get('model', ''))
-                            else:
-                                model_name = str(model)
-                            if model_name:
-                                available_models.append(model_name)
-                elif isinstance(models_response, list):
-                    for model in models_response:
-                        if hasattr(model, 'name'):
-                            available_models.append(model.name)
-                        elif isinstance(model, dict):
-                            available_models.append(model.get('name', str(model)))
-                        else:
-                            available_models.append(str(model))
+                for model in model_entries(models_response):
+                    model_name = model.get('name', model.get('model', '')) if isinstance(model, dict) else str(model)
+                    if model_name:
+                        available_models.append(model_name)
                 
                 logger.info(f"Available models: {available_models}")
 
@@ -56,15 +295,14 @@ class OllamaClient:
                     logger.warning(f"Model {self.model} not found. Available models: {available_models}")
 
                     logger.info(f"Attempting to pull model {self.model}")
-                    try:
-                        self.client.pull(self.model)
-                        logger.info(f"Successfully pulled model {self.model}")
-                    except Exception as e:
-                        logger.error(f"Failed to pull model {self.model}: {e}")
-                        if available_models:
-                            logger.info(f"Using first available model: {available_models[0]}")
-                            self.model = available_models[0]
-                        else:
+                    if available_models:
+                        self._pull_with_fallback(available_models[0])
+                    else:
+                        try:
+                            self.client.pull(self.model)
+                            logger.info(f"Successfully pulled model {self.model}")
+                        except Exception as e:
+                            logger.error(f"Failed to pull model {self.model}: {e}")
                             raise
                 
                 logger.info(f"Ollama client initialized with model: {self.model}")
@@ -78,10 +316,84 @@ class OllamaClient:
             logger.error(f"Failed to initialize Ollama client: {e}")
             self.client = None
     
+    def _pull_with_fallback(self, fallback_model: str):
+        # warm the fallback while the pull runs so a slow download doesn't block startup
+        target_model = self.model
+        executor = ThreadPoolExecutor(max_workers=2)
+        pull_future = executor.submit(self.client.pull, target_model)
+        warm_future = executor.submit(
+            self.client.generate,
+            model=fallback_model,
+            prompt=' ',
+            options={'num_predict': 1},
+            keep_alive=self.keep_alive
+        )
+        executor.shutdown(wait=False)
+
+        wait([pull_future, warm_future], return_when=FIRST_COMPLETED)
+        if pull_future.done() and pull_future.exception() is None:
+            logger.info(f"Successfully pulled model {target_model}")
+            return
+
+        # the fallback is only worth switching to once it has actually loaded
+        if warm_future.exception() is not None:
+            logger.error(f"Failed to warm fallback model {fallback_model}: {warm_future.exception()}")
+            if pull_future.exception() is not None:
+                raise pull_future.exception()
+            logger.info(f"Successfully pulled model {target_model}")
+            return
+
+        logger.info(f"Using first available model: {fallback_model}")
+        self.model = fallback_model
+
+        def _on_pull_done(future):
+            if future.exception() is None:
+                logger.info(f"Background pull of {target_model} finished, switching to it")
+                # applied by the next request so a call in flight keeps one model throughout
+                with self._model_lock:
+                    self._pending_model = target_model
+            else:
+                logger.error(f"Failed to pull model {target_model}: {future.exception()}")
+
+        pull_future.add_done_callback(_on_pull_done)
+
+    def _current_model(self) -> str:
+        with self._model_lock:
+            if self._pending_model is not None:
+                self.model = self._pending_model
+                self._pending_model = None
+            return self.model
+    
     def is_available(self) -> bool:
         return self.client is not None and self.config.OLLAMA_ENABLE
     
-    def generate(self, prompt: str, system_prompt: str = None, max_tokens: int = None, temperature: float = None) -> Optional[str]:
+    def _system_message(self, system_prompt: str) -> Dict[str, str]:
+        # identical system prefix on every call lets ollama reuse its prompt cache
+        system_message = self._system_messages.get(system_prompt)
+        if system_message is None:
+            system_message = {'role': 'system', 'content': system_prompt}
+            self._system_messages[system_prompt] = system_message
+        return system_message
+    
+    def warm_up(self, prompt_key: str) -> bool:
+        # prefill one of the fixed system prompts so a following batch starts from a cached prefix
+        if not self.is_available():
+            return False
+        
+        try:
+            self.client.chat(
+                model=self._current_model(),
+                messages=[self._system_message(self._system_prompts[prompt_key])],
+                options={'num_predict': 1},
+                keep_alive=self.keep_alive
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"Ollama warm-up for {prompt_key} failed: {e}")
+            return False
+    
+    def generate(self, prompt: str, system_prompt: str = None, max_tokens: int = None, temperature: float = None,
+                 format: Any = None) -> Optional[str]:
         if not self.is_available():
             logger.warning("Ollama client not available")
             return None
@@ -90,117 +402,91 @@ class OllamaClient:
             messages = []
             
             if system_prompt:
-                messages.append({
-                    'role': 'system',
-                    'content': system_prompt
-                })
+                messages.append(self._system_message(system_prompt))
             
             messages.append({
                 'role': 'user',
                 'content': prompt
             })
             
+            chat_kwargs = {}
+            if format:
+                chat_kwargs['format'] = format
+            
             response = self.client.chat(
-                model=self.model,
+                model=self._current_model(),
                 messages=messages,
                 options={
                     'temperature': temperature or self.temperature,
                     'num_predict': max_tokens or self.max_tokens
-                }
+                },
+                keep_alive=self.keep_alive,
+                **chat_kwargs
             )
             
-            return response['message']['content'].strip()
+            return _message_content(response).strip()
             
         except Exception as e:
             logger.error(f"Error generating response from Ollama: {e}")
             return None
     
     def analyze_web_content(self, content: str, context: str = "", question: str = "") -> Optional[Dict[str, Any]]:
-        system_prompt = """You are an expert OSINT analyst specializing in digital forensics and intelligence correlation. 
-        Your task is to analyze web content and extract relevant information that could correlate with digital forensic evidence.
-        
-        Focus on:
-        - Temporal references (dates, times, events)
-        - Geographic references (locations, places)
-        - Security-related topics (breaches, incidents, malware)
-        - Social movements or events
-        - Technical references that might relate to computer systems
-        - Suspicious activities or anomalies
-        
-        Return your analysis as a JSON object with these fields:
-        - summary: Brief summary of the content
-        - temporal_indicators: List of time/date references found
-        - geographic_indicators: List of location references found
-        - security_relevance: Security-related topics (0-10 scale)
-        - key_entities: Important people, organizations, or systems mentioned
-        - suspicious_indicators: Any suspicious activities or anomalies
-        - correlation_potential: How likely this content is to correlate with forensic evidence (0-10 scale)
-        """
-        
-        prompt = f"""Analyze the following web content for intelligence correlation potential:
-
-Context: {context}
-Question: {question}
-
-Web Content:
-{content[:4000]}
-
-Provide analysis as JSON:"""
+        prompt = _WEB_CONTENT_PROMPT.substitute(context=context, question=question, content=content[:4000])
 
         try:
-            response = self.generate(prompt, system_prompt, max_tokens=2048)
+            response = self.generate(
+                prompt, self.WEB_CONTENT_SYSTEM_PROMPT, max_tokens=self.json_max_tokens, format=_WEB_CONTENT_SCHEMA
+            )
             if response:
-                import re
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
-                else:
-                    return {
-                        "summary": response[:200],
-                        "temporal_indicators": [],
-                        "geographic_indicators": [],
-                        "security_relevance": 5,
-                        "key_entities": [],
-                        "suspicious_indicators": [],
-                        "correlation_potential": 3
-                    }
+                return _loads(response)
         except Exception as e:
             logger.error(f"Error analyzing web content: {e}")
             
         return None
     
-    def generate_search_queries(self, forensic_context: str, location: str = "", timeframe: str = "") -> List[str]:
-        system_prompt = """You are an expert OSINT researcher specializing in forensic-intelligence correlation. Generate highly targeted web search queries based on forensic evidence analysis.
+    def analyze_web_content_batch(self, contents: List[str], context: str = "", question: str = "") -> List[Optional[Dict[str, Any]]]:
+        # several documents per prompt, and the prompts themselves run side by side
+        batches = [
+            list(range(start, min(start + self.web_batch_size, len(contents))))
+            for start in range(0, len(contents), self.web_batch_size)
+        ]
+        analyses = [None] * len(contents)
+        if not batches:
+            return analyses
 
-        Create queries that would find content directly related to the forensic findings:
-        - Security incidents involving similar file types/activities
-        - Public reports of malware/attacks with matching patterns
-        - Technical analysis of similar threats or vulnerabilities
-        - News articles about cybersecurity incidents in the geographic area
-        - Social media discussions about suspicious activities
-        - Threat intelligence reports matching the indicators
-        
-        Important: 
-        - Prioritize queries that match specific forensic indicators (file names, types, locations)
-        - Include both technical security terms and plain language descriptions
-        - Consider geographic and temporal context for relevance
-        - Focus on findable, indexable content that would appear in search results
-        
-        Return only search queries, one per line, maximum 12 queries. Start with the most specific/evidence-based queries."""
-        
-        prompt = f"""Generate highly targeted web search queries for forensic-OSINT correlation:
+        def analyze_batch(indexes):
+            documents = "\n\n".join(f"Document {i}:\n{contents[i][:1500]}" for i in indexes)
+            prompt = _WEB_CONTENT_BATCH_PROMPT.substitute(context=context, question=question, documents=documents)
+            response = self.generate(
+                prompt, self.WEB_CONTENT_SYSTEM_PROMPT,
+                max_tokens=self.json_max_tokens * len(indexes), format=_WEB_CONTENT_BATCH_SCHEMA
+            )
+            return indexes, _loads(response).get('analyses', []) if response else []
 
-FORENSIC EVIDENCE ANALYSIS:
-{forensic_context}
+        with ThreadPoolExecutor(max_workers=min(4, len(batches))) as executor:
+            futures = [executor.submit(analyze_batch, indexes) for indexes in batches]
+            for future in futures:
+                try:
+                    indexes, batch_analyses = future.result()
+                except Exception as e:
+                    logger.error(f"Error analyzing web content batch: {e}")
+                    continue
 
-INVESTIGATION CONTEXT:
-- Location: {location}
-- Timeframe: {timeframe}
+                # join back by the index the model echoed, ignoring anything outside this batch
+                for analysis in batch_analyses:
+                    index = analysis.pop('index', None)
+                    if index in indexes:
+                        analyses[index] = analysis
 
-Generate search queries prioritized by specificity and evidence correlation potential:"""
+        return analyses
+    
+    def generate_search_queries(self, forensic_context: str, location: str = "", timeframe: str = "") -> List[str]:
+        prompt = _SEARCH_QUERY_PROMPT.substitute(
+            forensic_context=forensic_context, location=location, timeframe=timeframe
+        )
 
         try:
-            response = self.generate(prompt, system_prompt, max_tokens=1024)
+            response = self.generate(prompt, self.SEARCH_QUERY_SYSTEM_PROMPT, max_tokens=self.query_max_tokens)
             if response:
                 queries = [q.strip() for q in response.split('\n') if q.strip() and not q.strip().startswith('#')]
                 return queries[:12]
@@ -210,78 +496,45 @@ Generate search queries prioritized by specificity and evidence correlation pote
         return []
     
     def analyze_correlation_relevance(self, forensic_event: Dict, osint_content: str) -> Optional[Dict[str, Any]]:
-        system_prompt = """You are an expert digital forensics analyst. Analyze the correlation potential between 
-        a forensic event and OSINT content. Consider temporal, contextual, and semantic relationships.
-        
-        Rate correlation strength from 0-10 based on:
-        - Temporal proximity and relevance
-        - Content similarity and context
-        - Geographic correlation
-        - Security relevance
-        - Suspicious patterns
-        
-        Return analysis as JSON with:
-        - correlation_score: 0-10 rating
-        - reasoning: Explanation of the correlation
-        - confidence: Confidence level (0-10)
-        - key_connections: Specific connections found
-        - recommendations: Suggested follow-up actions
-        """
-        
-        forensic_summary = f"""Forensic Event:
-- File: {forensic_event.get('file_path', 'Unknown')}
-- Event Type: {forensic_event.get('event_type', 'Unknown')}
-- Timestamp: {forensic_event.get('timestamp', 'Unknown')}
-- File Type: {forensic_event.get('file_type', 'Unknown')}
-- Size: {forensic_event.get('file_size', 'Unknown')} bytes"""
+        fe = forensic_event
+        forensic_summary = _FORENSIC_SUMMARY_TMPL.substitute(
+            file_path=fe.get('file_path', 'Unknown'),
+            event_type=fe.get('event_type', 'Unknown'),
+            timestamp=fe.get('timestamp', 'Unknown'),
+            file_type=fe.get('file_type', 'Unknown'),
+            file_size=fe.get('file_size', 'Unknown')
+        )
 
-        prompt = f"""{forensic_summary}
-
-OSINT Content:
-{osint_content[:2000]}
-
-Analyze correlation potential and return as JSON:"""
+        prompt = _CORR_PROMPT.substitute(forensic_summary=forensic_summary, osint=osint_content[:2000])
 
         try:
-            response = self.generate(prompt, system_prompt, max_tokens=1536)
+            response = self.generate(
+                prompt, self.CORRELATION_SYSTEM_PROMPT, max_tokens=self.json_max_tokens, format=_CORRELATION_SCHEMA
+            )
             if response:
-                import re
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
+                return _loads(response)
         except Exception as e:
             logger.error(f"Error analyzing correlation relevance: {e}")
             
         return None
     
     def summarize_investigation_findings(self, correlations: List[Dict], forensic_summary: str, osint_summary: str) -> str:
-        system_prompt = """You are an expert digital forensics report writer. Summarize investigation findings 
-        in a professional, clear manner suitable for law enforcement or security professionals.
-        
-        Focus on:
-        - Key correlations discovered
-        - Timeline of events
-        - Geographic patterns
-        - Security implications
-        - Recommended actions
-        
-        Write in a clear, professional tone suitable for investigators."""
+        if correlations:
+            avg_strength = sum(c.get('correlation_strength', 0) for c in correlations) / len(correlations)
+            correlations_summary = f"Found {len(correlations)} correlations with an average strength of {avg_strength:.2f}"
+        else:
+            correlations_summary = "No correlations found"
         
-        correlations_summary = f"Found {len(correlations)} correlations with an average strength of " + \
-                              f"{sum(c.get('correlation_strength', 0) for c in correlations) / len(correlations):.2f}" if correlations else "No correlations found"
-        
-        prompt = f"""Investigation Summary:
-
-Forensic Analysis: {forensic_summary}
-
-OSINT Collection: {osint_summary}
-
-Correlations: {correlations_summary}
-
-Generate a comprehensive investigation summary report:"""
+        prompt = _SUMMARY_PROMPT.substitute(
+            forensic_summary=forensic_summary,
+            osint_summary=osint_summary,
+            correlations_summary=correlations_summary
+        )
 
         try:
-            response = self.generate(prompt, system_prompt, max_tokens=2048, temperature=0.2)
+            response = self.generate(
+                prompt, self.SUMMARY_SYSTEM_PROMPT, max_tokens=self.summary_max_tokens, temperature=0.2
+            )
             return response if response else "Unable to generate investigation summary"
         except Exception as e:
             logger.error(f"Error summarizing investigation findings: {e}")
@@ -1,9 +1,14 @@
-import ollama
+import httpx
 import logging
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any
+
+from llm_client import get_shared_client, model_entries
 
 logger = logging.getLogger(__name__)
 
+_CONNECTION_ERRORS = (ConnectionError, httpx.ConnectError, httpx.ConnectTimeout)
+
 class OllamaModelManager:
     def __init__(self, config):
         self.config = config
@@ -58,13 +63,19 @@ class OllamaModelManager:
     
     def _initialize_client(self):
         try:
-            self.client = ollama.Client(host=self.config.OLLAMA_HOST)
+            self.client = get_shared_client(self.config.OLLAMA_HOST)
             self.client.list()
             logger.info("Ollama model manager initialized")
         except Exception as e:
             logger.error(f"Failed to connect to Ollama: {e}")
             self.client = None
     
+    def _ensure_client(self) -> bool:
+        # in-process check only; the actual call reports a dead server
+        if self.client is None and self.config.OLLAMA_ENABLE:
+            self._initialize_client()
+        return self.client is not None
+    
     def is_ollama_available(self) -> bool:
         if not self.config.OLLAMA_ENABLE:
             return False
@@ -82,26 +93,25 @@ class OllamaModelManager:
         return False
     
     def get_installed_models(self) -> List[Dict[str, Any]]:
-        if not self.is_ollama_available():
+        if not self._ensure_client():
             return []
         
         try:
             models_response = self.client.list()
             models = []
             
-            if isinstance(models_response, dict) and 'models' in models_response:
-                for model in models_response['models']:
-                    if isinstance(model, dict):
-                        model_info = {
-                            'name': model.get('name', model.get('model', '')),
-                            'size': model.get('size', 0),
-                            'modified': model.get('modified_at', ''),
-                            'details': model.get('details', {}),
-                            'digest': model.get('digest', ''),
-                            'status': 'installed'
-                        }
-                        if model_info['name']:
-                            models.append(model_info)
+            for model in model_entries(models_response):
+                if isinstance(model, dict):
+                    model_info = {
+                        'name': model.get('name', model.get('model', '')),
+                        'size': model.get('size', 0),
+                        'modified': model.get('modified_at', ''),
+                        'details': model.get('details', {}),
+                        'digest': model.get('digest', ''),
+                        'status': 'installed'
+                    }
+                    if model_info['name']:
+                        models.append(model_info)
             
             return models
             
@@ -141,13 +151,30 @@ class OllamaModelManager:
             'total_recommended': len(recommended_models)
         }
     
-    def pull_model(self, model_name: str) -> Dict[str, Any]:
-        if not self.is_ollama_available():
+    def pull_model(self, model_name: str, on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        if not self._ensure_client():
             return {'success': False, 'error': 'Ollama not available'}
         
         try:
             logger.info(f"Starting pull for model: {model_name}")
-            self.client.pull(model_name)
+            # a list() alongside the pull opens a second pooled connection, so the check afterwards skips the handshake
+            warm_executor = ThreadPoolExecutor(max_workers=1)
+            warm_executor.submit(self.client.list)
+            warm_executor.shutdown(wait=False)
+            
+            # the server resumes partially downloaded layers on its own
+            for event in self.client.pull(model_name, stream=True):
+                if on_progress:
+                    on_progress({
+                        'model_name': model_name,
+                        'status': event.get('status'),
+                        'completed': event.get('completed'),
+                        'total': event.get('total')
+                    })
+            
+            installed_names = {model['name'] for model in self.get_installed_models()}
+            if model_name not in installed_names and f'{model_name}:latest' not in installed_names:
+                logger.warning(f"Model {model_name} not listed after pull")
             
             return {
                 'success': True,
@@ -157,14 +184,23 @@ class OllamaModelManager:
             
         except Exception as e:
             logger.error(f"Error pulling model {model_name}: {e}")
+            if isinstance(e, _CONNECTION_ERRORS):
+                return {'success': False, 'error': 'Ollama not available'}
             return {
                 'success': False,
                 'error': f'Failed to pull model {model_name}: {str(e)}',
                 'model_name': model_name
             }
     
+    def pull_models(self, model_names: List[str], on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        if not model_names:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(4, len(model_names))) as executor:
+            return list(executor.map(lambda name: self.pull_model(name, on_progress), model_names))
+    
     def delete_model(self, model_name: str) -> Dict[str, Any]:
-        if not self.is_ollama_available():
+        if not self._ensure_client():
             return {'success': False, 'error': 'Ollama not available'}
         
         try:
@@ -178,6 +214,8 @@ class OllamaModelManager:
             
         except Exception as e:
             logger.error(f"Error deleting model {model_name}: {e}")
+            if isinstance(e, _CONNECTION_ERRORS):
+                return {'success': False, 'error': 'Ollama not available'}
             return {
                 'success': False,
                 'error': f'Failed to delete model {model_name}: {str(e)}',
@@ -185,7 +223,7 @@ class OllamaModelManager:
             }
     
     def test_model(self, model_name: str) -> Dict[str, Any]:
-        if not self.is_ollama_available():
+        if not self._ensure_client():
             return {'success': False, 'error': 'Ollama not available'}
         
         try:
@@ -194,7 +232,8 @@ class OllamaModelManager:
             response = self.client.chat(
                 model=model_name,
                 messages=[{'role': 'user', 'content': test_prompt}],
-                options={'num_predict': 10}
+                options={'num_predict': 2, 'temperature': 0.0, 'top_k': 1, 'seed': 42},
+                keep_alive=self.config.OLLAMA_KEEP_ALIVE
             )
             
             response_text = response['message']['content'].strip()
@@ -208,6 +247,8 @@ class OllamaModelManager:
             
         except Exception as e:
             logger.error(f"Error testing model {model_name}: {e}")
+            if isinstance(e, _CONNECTION_ERRORS):
+                return {'success': False, 'error': 'Ollama not available'}
             return {
                 'success': False,
                 'error': f'Model test failed: {str(e)}',
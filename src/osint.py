@@ -1,53 +1,180 @@
-import requests
+import asyncio
+import hashlib
+import heapq
+import io
+import math
+import orjson
+import re
+import httpx
 import tweepy
 import praw
 import logging
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from geopy.adapters import RequestsAdapter
 from geopy.geocoders import Nominatim
-from bs4 import BeautifulSoup
+from lxml import etree
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import partial
+from operator import itemgetter
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from advanced_web_intelligence import AdvancedWebIntelligenceCollector
+from cache import open_cache
 
 logger = logging.getLogger(__name__)
 
+_GEOCODE_MEMO_SIZE = 256
+
+_SUSPICIOUS_EXT_RE = re.compile(r'\.(?:exe|bat|ps1|dll|scr|com)$', re.IGNORECASE)
+
+_REDDIT_TIME_FILTERS = (
+    (timedelta(hours=1), "hour"),
+    (timedelta(days=1), "day"),
+    (timedelta(weeks=1), "week"),
+    (timedelta(days=30), "month"),
+    (timedelta(days=365), "year")
+)
+
+
+@dataclass(slots=True)
+class OSINTRecord(Mapping):
+    timestamp: datetime
+    source: str
+    content: str
+    author: str
+    location: str
+    coordinates: Optional[dict]
+    engagement: dict
+    url: str
+    data: dict
+    llm_analysis: Optional[dict] = None
+
+    # mapping view over the fields so records pass straight into the database and correlation code
+    def __getitem__(self, key):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self):
+        return iter(self.__dataclass_fields__)
+
+    def __len__(self):
+        return len(self.__dataclass_fields__)
+
+
+class TokenBucketLimiter:
+    # tracks the quota an API reports back so we wait for the reset instead of hitting a 429
+    def __init__(self):
+        self.remaining = None
+        self.reset_at = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, remaining, reset_at):
+        with self._lock:
+            if remaining is not None:
+                self.remaining = float(remaining)
+            if reset_at:
+                self.reset_at = float(reset_at)
+
+    def observe(self, response, *args, **kwargs):
+        headers = response.headers
+        self.update(headers.get('x-rate-limit-remaining'), headers.get('x-rate-limit-reset'))
+
+    def exhaust(self, reset_at):
+        self.update(0, reset_at)
+
+    def ready_at(self):
+        with self._lock:
+            if self.remaining is None or self.remaining >= 1 or self.reset_at <= time.time():
+                return 0.0
+            return self.reset_at
+
+    def wait(self):
+        delay = self.ready_at() - time.time()
+        if delay > 0:
+            logger.info(f"Rate limit exhausted, waiting {delay:.0f}s for reset")
+            time.sleep(delay)
+
+
 class OSINTCollector:
     def __init__(self, config):
         self.config = config
-        self.geolocator = Nominatim(user_agent=config.REDDIT_USER_AGENT)
+        self.geolocator = Nominatim(
+            user_agent=config.REDDIT_USER_AGENT,
+            adapter_factory=partial(RequestsAdapter, pool_connections=8, pool_maxsize=8)
+        )
+        self._geocode_cache = open_cache(config, 'geocode')
+        # small in-process LRU in front of the disk cache, entries keep the same expiry
+        self._geocode_memo = OrderedDict()
+        self._geocode_memo_lock = threading.Lock()
+        self._web_intel_cache = open_cache(config, 'webint')
+        self._request_cache = open_cache(config, 'osint', size_limit=int(2e9))
         
-        self.twitter_api = None
+        self.twitter_client = None
+        self.twitter_clients = []
         self.reddit_api = None
+        self.reddit_limiter = TokenBucketLimiter()
         self.web_intelligence = AdvancedWebIntelligenceCollector(config) if config.WEB_SEARCH_ENABLE else None
         
         self._setup_twitter_api()
         self._setup_reddit_api()
     
     def _setup_twitter_api(self):
-        if not all([
+        credentials = list(self.config.TWITTER_CREDENTIALS)
+        if self.config.TWITTER_BEARER_TOKEN or all([
             self.config.TWITTER_API_KEY,
             self.config.TWITTER_API_SECRET,
             self.config.TWITTER_ACCESS_TOKEN,
             self.config.TWITTER_ACCESS_TOKEN_SECRET
         ]):
+            credentials.insert(0, {
+                'bearer_token': self.config.TWITTER_BEARER_TOKEN,
+                'api_key': self.config.TWITTER_API_KEY,
+                'api_secret': self.config.TWITTER_API_SECRET,
+                'access_token': self.config.TWITTER_ACCESS_TOKEN,
+                'access_token_secret': self.config.TWITTER_ACCESS_TOKEN_SECRET
+            })
+        
+        if not credentials:
             logger.warning("Twitter API credentials not configured")
             return
-            
-        try:
-            auth = tweepy.OAuthHandler(
-                self.config.TWITTER_API_KEY, 
-                self.config.TWITTER_API_SECRET
-            )
-            auth.set_access_token(
-                self.config.TWITTER_ACCESS_TOKEN,
-                self.config.TWITTER_ACCESS_TOKEN_SECRET
-            )
-            self.twitter_api = tweepy.API(auth, wait_on_rate_limit=True)
-            
-            self.twitter_api.verify_credentials()
-            logger.info("Twitter API authentication successful")
-            
-        except Exception as e:
-            logger.error(f"Twitter API setup failed: {e}")
+        
+        for index, credential in enumerate(credentials):
+            try:
+                # app-only bearer auth when available, otherwise the OAuth 1.0a user context
+                user_auth = not credential.get('bearer_token')
+                client = tweepy.Client(
+                    bearer_token=credential.get('bearer_token') or None,
+                    consumer_key=credential.get('api_key') or None,
+                    consumer_secret=credential.get('api_secret') or None,
+                    access_token=credential.get('access_token') or None,
+                    access_token_secret=credential.get('access_token_secret') or None,
+                    # the pooled search schedules around the reported quota instead of sleeping on a 429
+                    wait_on_rate_limit=False
+                )
+                limiter = TokenBucketLimiter()
+                client.session.hooks['response'].append(limiter.observe)
+                
+                if user_auth:
+                    client.get_me(user_auth=True)
+                self.twitter_clients.append((client, user_auth, limiter))
+                
+            except Exception as e:
+                logger.error(f"Twitter API setup failed for credential {index}: {e}")
+        
+        if self.twitter_clients:
+            self.twitter_client = self.twitter_clients[0][0]
+            logger.info(f"Twitter API authentication successful ({len(self.twitter_clients)} credential(s))")
     
     def _setup_reddit_api(self):
         if not all([
@@ -61,7 +188,8 @@ class OSINTCollector:
             self.reddit_api = praw.Reddit(
                 client_id=self.config.REDDIT_CLIENT_ID,
                 client_secret=self.config.REDDIT_CLIENT_SECRET,
-                user_agent=self.config.REDDIT_USER_AGENT
+                user_agent=self.config.REDDIT_USER_AGENT,
+                ratelimit_seconds=600
             )
             logger.info("Reddit API setup successful")
             
@@ -73,25 +201,89 @@ class OSINTCollector:
             return None
 
         if isinstance(value, str):
-            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            # fromisoformat accepts the trailing 'Z' on 3.11+
+            value = datetime.fromisoformat(value)
 
         if value.tzinfo is not None:
             return value.astimezone(timezone.utc).replace(tzinfo=None)
 
         return value
     
+    def _request_cache_key(self, namespace, location, start_time, end_time, keywords):
+        if isinstance(keywords, list):
+            keyword_key = tuple(sorted(keywords))
+        else:
+            keyword_key = (keywords,) if keywords else ()
+        return (
+            namespace,
+            (location or '').strip().lower(),
+            keyword_key,
+            self._normalize_datetime(start_time).isoformat(),
+            self._normalize_datetime(end_time).isoformat()
+        )
+    
+    def _request_cache_get(self, namespace, key):
+        if self._request_cache is not None:
+            try:
+                cached = self._request_cache.get(key)
+                if cached is not None:
+                    logger.debug(f"Request cache hit for {namespace}")
+                    return cached
+            except Exception as e:
+                logger.warning(f"Request cache read failed for {namespace}: {e}")
+        return None
+    
+    def _request_cache_set(self, namespace, key, result):
+        if result and self._request_cache is not None:
+            try:
+                self._request_cache.set(key, result, expire=self.config.OSINT_CACHE_TTL_HOURS * 3600)
+            except Exception as e:
+                logger.warning(f"Request cache write failed for {namespace}: {e}")
+    
+    def _cached_collect(self, namespace, location, start_time, end_time, keywords, collect):
+        # identical pulls within the TTL are served from disk instead of hitting the API again
+        key = self._request_cache_key(namespace, location, start_time, end_time, keywords)
+        cached = self._request_cache_get(namespace, key)
+        if cached is not None:
+            return cached
+        
+        result = collect(location, start_time, end_time, keywords)
+        self._request_cache_set(namespace, key, result)
+        return result
+    
+    async def _cached_collect_async(self, namespace, location, start_time, end_time, keywords, client, collect):
+        key = self._request_cache_key(namespace, location, start_time, end_time, keywords)
+        cached = self._request_cache_get(namespace, key)
+        if cached is not None:
+            return cached
+        
+        result = await collect(client, location, start_time, end_time, keywords)
+        self._request_cache_set(namespace, key, result)
+        return result
+    
     def collect_twitter_data(self, location, start_time, end_time, keywords=None):
-        if not self.twitter_api:
+        if not self.twitter_client:
             logger.error("Twitter API not available")
             return []
-            
+        
+        return self._cached_collect('twitter', location, start_time, end_time, keywords, self._collect_twitter_data)
+    
+    def _collect_twitter_data(self, location, start_time, end_time, keywords):
         try:
             start_time = self._normalize_datetime(start_time)
             end_time = self._normalize_datetime(end_time)
-            geocode = self._get_geocode(location)
+            geocode = self.geocode_location(location)
             if not geocode:
                 logger.error(f"Could not geocode location: {location}")
                 return []
+            
+            # recent search only reaches back seven days and rejects an end_time in the future
+            now = datetime.utcnow()
+            search_start = max(start_time, now - timedelta(days=7) + timedelta(minutes=1))
+            search_end = min(end_time, now - timedelta(seconds=30))
+            if search_start >= search_end:
+                logger.warning("Requested window is outside Twitter's recent search range")
+                return []
                 
             query_parts = []
             if keywords:
@@ -100,47 +292,109 @@ class OSINTCollector:
                 else:
                     query_parts.append(keywords)
             
-            query = " OR ".join(query_parts) if query_parts else "*"
+            # point_radius is capped at 25 miles
+            radius_km = min(self.config.MAX_CORRELATION_DISTANCE_KM, 40)
+            query = f"point_radius:[{geocode['lon']} {geocode['lat']} {radius_km}km]"
+            if query_parts:
+                query = f"({' OR '.join(query_parts)}) {query}"
             
             tweets = []
-            for tweet in tweepy.Cursor(
-                self.twitter_api.search_tweets,
-                q=query,
-                geocode=f"{geocode['lat']},{geocode['lon']},{self.config.MAX_CORRELATION_DISTANCE_KM}km",
-                since=start_time.strftime('%Y-%m-%d'),
-                until=(end_time + timedelta(days=1)).strftime('%Y-%m-%d'),
-                tweet_mode='extended',
-                result_type='mixed'
-            ).items(self.config.MAX_OSINT_RESULTS):
-                tweet_time = self._normalize_datetime(tweet.created_at)
-
-                if start_time <= tweet_time <= end_time:
-                    tweets.append({
-                        'timestamp': tweet_time,
-                        'source': 'twitter',
-                        'content': tweet.full_text,
-                        'author': tweet.author.screen_name,
-                        'location': getattr(tweet, 'place', {}).get('full_name', '') if hasattr(tweet, 'place') and tweet.place else '',
-                        'coordinates': self._extract_coordinates(tweet),
-                        'engagement': {
-                            'retweets': tweet.retweet_count,
-                            'favorites': tweet.favorite_count,
-                            'replies': tweet.reply_count if hasattr(tweet, 'reply_count') else 0
+            for response in self._search_recent_pooled(
+                self.config.MAX_OSINT_RESULTS,
+                query=query,
+                start_time=search_start,
+                end_time=search_end,
+                tweet_fields=['created_at', 'author_id', 'entities', 'geo', 'public_metrics'],
+                expansions=['author_id', 'geo.place_id'],
+                user_fields=['username'],
+                place_fields=['full_name', 'geo']
+            ):
+                includes = response.includes or {}
+                usernames = {user.id: user.username for user in includes.get('users', [])}
+                places = {place.id: place for place in includes.get('places', [])}
+                
+                # start_time/end_time already bound the window server side
+                for tweet in response.data or []:
+                    tweet_time = self._normalize_datetime(tweet.created_at)
+                    username = usernames.get(tweet.author_id, str(tweet.author_id))
+                    geo = getattr(tweet, 'geo', None)
+                    place = places.get(geo.get('place_id')) if geo else None
+                    metrics = tweet.public_metrics or {}
+                    entities = tweet.entities or {}
+                    tweets.append(OSINTRecord(
+                        timestamp=tweet_time,
+                        source='twitter',
+                        content=tweet.text,
+                        author=username,
+                        location=getattr(place, 'full_name', None) or '',
+                        coordinates=self._extract_coordinates(tweet, place),
+                        engagement={
+                            'retweets': metrics.get('retweet_count', 0),
+                            'favorites': metrics.get('like_count', 0),
+                            'replies': metrics.get('reply_count', 0)
                         },
-                        'url': f"https://twitter.com/{tweet.author.screen_name}/status/{tweet.id}",
-                        'data': {
-                            'hashtags': [hashtag['text'] for hashtag in tweet.entities.get('hashtags', [])],
-                            'mentions': [mention['screen_name'] for mention in tweet.entities.get('user_mentions', [])],
-                            'urls': [url['expanded_url'] for url in tweet.entities.get('urls', [])]
+                        url=f"https://twitter.com/{username}/status/{tweet.id}",
+                        data={
+                            'hashtags': [hashtag['tag'] for hashtag in entities.get('hashtags', [])],
+                            'mentions': [mention['username'] for mention in entities.get('mentions', [])],
+                            'urls': [url['expanded_url'] for url in entities.get('urls', [])]
                         }
-                    })
-                    
+                    ))
+        
+            # recent search pages newest first; callers expect ascending timestamps
+            tweets.reverse()
             return tweets
             
         except Exception as e:
             logger.error(f"Error collecting Twitter data: {e}")
             return []
     
+    def _search_recent_pooled(self, limit, **params):
+        # page through v2 recent search, handing each page to the next credential that has quota left
+        clients = self.twitter_clients
+        next_index = 0
+        fetched = 0
+        next_token = None
+        
+        while fetched < limit:
+            now = time.time()
+            ready_at = [limiter.ready_at() for _, _, limiter in clients]
+            index = None
+            for offset in range(len(clients)):
+                candidate = (next_index + offset) % len(clients)
+                if ready_at[candidate] <= now:
+                    index = candidate
+                    break
+            
+            if index is None:
+                wait_seconds = max(0, min(ready_at) - now)
+                logger.info(f"All Twitter credentials rate limited, waiting {wait_seconds:.0f}s")
+                time.sleep(wait_seconds)
+                continue
+            
+            next_index = index + 1
+            client, user_auth, limiter = clients[index]
+            page_params = dict(params, max_results=max(10, min(100, limit - fetched)), user_auth=user_auth)
+            if next_token is not None:
+                page_params['next_token'] = next_token
+            
+            try:
+                response = client.search_recent_tweets(**page_params)
+            except tweepy.TooManyRequests as e:
+                reset = e.response.headers.get('x-rate-limit-reset') if e.response is not None else None
+                limiter.exhaust(reset or now + 15 * 60)
+                continue
+            
+            if not response.data:
+                break
+            
+            yield response
+            
+            fetched += len(response.data)
+            next_token = (response.meta or {}).get('next_token')
+            if not next_token:
+                break
+    
     def collect_reddit_data(self, location, start_time, end_time, subreddits=None, keywords=None):
         if not self.reddit_api:
             logger.error("Reddit API not available")
@@ -149,77 +403,146 @@ class OSINTCollector:
         try:
             start_time = self._normalize_datetime(start_time)
             end_time = self._normalize_datetime(end_time)
-            posts = []
+            post_runs = []
             search_terms = keywords if keywords else [""]
             target_subreddits = subreddits if subreddits else ["all"]
-            
-            for subreddit_name in target_subreddits:
-                try:
-                    subreddit = self.reddit_api.subreddit(subreddit_name)
-                    
-                    for search_term in search_terms:
-                        for submission in subreddit.search(
-                            search_term, 
-                            time_filter="all",
-                            sort="new",
-                            limit=self.config.MAX_OSINT_RESULTS // len(target_subreddits) // len(search_terms)
-                        ):
-                            post_time = self._normalize_datetime(
-                                datetime.fromtimestamp(submission.created_utc, tz=timezone.utc)
-                            )
-                            
-                            if start_time <= post_time <= end_time:
-                                posts.append({
-                                    'timestamp': post_time,
-                                    'source': 'reddit',
-                                    'content': f"{submission.title}\n{submission.selftext}"[:1000],
-                                    'author': str(submission.author) if submission.author else '[deleted]',
-                                    'location': location,
-                                    'coordinates': None,
-                                    'engagement': {
-                                        'score': submission.score,
-                                        'upvote_ratio': submission.upvote_ratio,
-                                        'comments': submission.num_comments
-                                    },
-                                    'url': f"https://reddit.com{submission.permalink}",
-                                    'data': {
-                                        'subreddit': submission.subreddit.display_name,
-                                        'flair': submission.link_flair_text,
-                                        'gilded': submission.gilded,
-                                        'stickied': submission.stickied
-                                    }
-                                })
-                                
-                except Exception as e:
-                    logger.warning(f"Error processing subreddit {subreddit_name}: {e}")
-                    continue
+            limit = self.config.MAX_OSINT_RESULTS // len(target_subreddits) // len(search_terms)
+            
+            tasks = [
+                (subreddit_name, search_term)
+                for subreddit_name in target_subreddits
+                for search_term in search_terms
+            ]
+            
+            with ThreadPoolExecutor(max_workers=min(16, len(tasks))) as executor:
+                futures = {
+                    executor.submit(
+                        self._search_subreddit, subreddit_name, search_term, limit, location, start_time, end_time
+                    ): subreddit_name
+                    for subreddit_name, search_term in tasks
+                }
+                
+                for future in as_completed(futures):
+                    try:
+                        post_runs.append(future.result())
+                    except Exception as e:
+                        logger.warning(f"Error processing subreddit {futures[future]}: {e}")
+                        continue
                     
-            return posts
+            return list(heapq.merge(*post_runs, key=itemgetter('timestamp')))
             
         except Exception as e:
             logger.error(f"Error collecting Reddit data: {e}")
             return []
     
+    def _search_subreddit(self, subreddit_name, search_term, limit, location, start_time, end_time):
+        posts = []
+        subreddit = self.reddit_api.subreddit(subreddit_name)
+        
+        # auth.limits reflects the headers of the last Reddit response
+        limits = self.reddit_api.auth.limits
+        self.reddit_limiter.update(limits.get('remaining'), limits.get('reset_timestamp'))
+        self.reddit_limiter.wait()
+        
+        # both listings run newest first, so the scan stops at the first post older than the window
+        if search_term:
+            submissions = subreddit.search(
+                search_term,
+                time_filter=self._reddit_time_filter(start_time),
+                sort="new",
+                limit=None
+            )
+        else:
+            submissions = subreddit.new(limit=None)
+        
+        for submission in submissions:
+            post_time = self._normalize_datetime(
+                datetime.fromtimestamp(submission.created_utc, tz=timezone.utc)
+            )
+            
+            if post_time < start_time:
+                break
+            
+            if post_time <= end_time:
+                posts.append(OSINTRecord(
+                    timestamp=post_time,
+                    source='reddit',
+                    content=f"{submission.title}\n{submission.selftext}"[:1000],
+                    author=str(submission.author) if submission.author else '[deleted]',
+                    location=location,
+                    coordinates=None,
+                    engagement={
+                        'score': submission.score,
+                        'upvote_ratio': submission.upvote_ratio,
+                        'comments': submission.num_comments
+                    },
+                    url=f"https://reddit.com{submission.permalink}",
+                    data={
+                        'subreddit': submission.subreddit.display_name,
+                        'flair': submission.link_flair_text,
+                        'gilded': submission.gilded,
+                        'stickied': submission.stickied
+                    }
+                ))
+                if len(posts) >= limit:
+                    break
+        
+        # sort="new" yields newest first
+        posts.reverse()
+        return posts
+    
+    def _reddit_time_filter(self, start_time):
+        # narrowest search bucket that still reaches back to start_time
+        age = datetime.utcnow() - start_time
+        for span, time_filter in _REDDIT_TIME_FILTERS:
+            if age <= span:
+                return time_filter
+        return "all"
+    
     def collect_news_data(self, location, start_time, end_time, keywords=None):
+        return asyncio.run(self.collect_news_data_async(location, start_time, end_time, keywords))
+    
+    async def collect_news_data_async(self, location, start_time, end_time, keywords=None, client=None):
+        if client is None:
+            async with self._async_http_client() as client:
+                return await self.collect_news_data_async(location, start_time, end_time, keywords, client)
+        
         try:
-            articles = []
+            tasks = []
             
             if self.config.NEWS_API_KEY:
-                articles.extend(self._collect_newsapi_data(location, start_time, end_time, keywords))
+                tasks.append(self._cached_collect_async(
+                    'newsapi', location, start_time, end_time, keywords, client, self._collect_newsapi_data
+                ))
             
-            articles.extend(self._collect_google_news_data(location, start_time, end_time, keywords))
+            tasks.append(self._cached_collect_async(
+                'google_news', location, start_time, end_time, keywords, client, self._collect_google_news_data
+            ))
             
-            return articles
+            article_runs = await asyncio.gather(*tasks)
+            return list(heapq.merge(*article_runs, key=itemgetter('timestamp')))
             
         except Exception as e:
             logger.error(f"Error collecting news data: {e}")
             return []
     
-    def _collect_newsapi_data(self, location, start_time, end_time, keywords):
+    def _async_http_client(self):
+        # async clients are bound to the loop that uses them, so one is opened per collection run
+        return httpx.AsyncClient(
+            timeout=30,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+            )
+        )
+    
+    async def _collect_newsapi_data(self, client, location, start_time, end_time, keywords):
         try:
             start_time = self._normalize_datetime(start_time)
             end_time = self._normalize_datetime(end_time)
             url = "https://newsapi.org/v2/everything"
+            page_size = min(100, self.config.MAX_OSINT_RESULTS)
             
             query_parts = [location]
             if keywords:
@@ -230,46 +553,69 @@ class OSINTCollector:
             
             params = {
                 'q': " AND ".join(query_parts),
-                'from': start_time.strftime('%Y-%m-%d'),
-                'to': end_time.strftime('%Y-%m-%d'),
+                'from': start_time.isoformat(timespec='seconds'),
+                'to': end_time.isoformat(timespec='seconds'),
                 'sortBy': 'publishedAt',
                 'language': 'en',
-                'pageSize': min(100, self.config.MAX_OSINT_RESULTS),
+                'pageSize': page_size,
                 'apiKey': self.config.NEWS_API_KEY
             }
             
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
+            data = await self._fetch_newsapi_page(client, url, params, 1)
+            pages = [data.get('articles', [])]
+            
+            # page one tells us how many results exist; fetch the rest side by side
+            page_count = min(
+                math.ceil(data.get('totalResults', 0) / page_size),
+                math.ceil(self.config.MAX_OSINT_RESULTS / page_size)
+            )
+            if page_count > 1:
+                results = await asyncio.gather(
+                    *(self._fetch_newsapi_page(client, url, params, page) for page in range(2, page_count + 1)),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.warning(f"Error fetching NewsAPI page: {result}")
+                        continue
+                    pages.append(result.get('articles', []))
             
-            data = response.json()
             articles = []
             
-            for article in data.get('articles', []):
+            for article in (article for page in pages for article in page):
                 pub_date = self._normalize_datetime(article['publishedAt'])
                 
-                articles.append({
-                    'timestamp': pub_date,
-                    'source': 'news_api',
-                    'content': f"{article['title']}\n{article.get('description', '')}"[:1000],
-                    'author': article.get('author', 'Unknown'),
-                    'location': location,
-                    'coordinates': None,
-                    'engagement': {},
-                    'url': article['url'],
-                    'data': {
+                articles.append(OSINTRecord(
+                    timestamp=pub_date,
+                    source='news_api',
+                    content=f"{article['title']}\n{article.get('description', '')}"[:1000],
+                    author=article.get('author', 'Unknown'),
+                    location=location,
+                    coordinates=None,
+                    engagement={},
+                    url=article['url'],
+                    data={
                         'source_name': article['source']['name'],
                         'image_url': article.get('urlToImage', ''),
                         'content_preview': article.get('content', '')[:200]
                     }
-                })
-                
+                ))
+            
+            # sortBy=publishedAt returns newest first
+            del articles[self.config.MAX_OSINT_RESULTS:]
+            articles.reverse()
             return articles
             
         except Exception as e:
             logger.error(f"Error with NewsAPI: {e}")
             return []
     
-    def _collect_google_news_data(self, location, start_time, end_time, keywords):
+    async def _fetch_newsapi_page(self, client, url, params, page):
+        response = await client.get(url, params={**params, 'page': page})
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def _collect_google_news_data(self, client, location, start_time, end_time, keywords):
         try:
             start_time = self._normalize_datetime(start_time)
             end_time = self._normalize_datetime(end_time)
@@ -284,70 +630,122 @@ class OSINTCollector:
             
             query = " ".join(query_parts)
             
-            search_url = f"https://news.google.com/rss/search?q={requests.utils.quote(query)}&hl=en-US&gl=US&ceid=US:en"
-            
-            response = requests.get(search_url, timeout=30)
+            response = await client.get(
+                "https://news.google.com/rss/search",
+                params={'q': query, 'hl': 'en-US', 'gl': 'US', 'ceid': 'US:en'}
+            )
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'xml')
+            item_limit = min(50, self.config.MAX_OSINT_RESULTS)
+            seen_items = 0
             
-            for item in soup.find_all('item')[:min(50, self.config.MAX_OSINT_RESULTS)]:
+            # stream the feed and drop each <item> once read instead of building the whole tree
+            for _, item in etree.iterparse(io.BytesIO(response.content), events=('end',), tag='item'):
                 try:
-                    pub_date_str = item.pubDate.text
-                    pub_date = self._normalize_datetime(
-                        datetime.strptime(pub_date_str, '%a, %d %b %Y %H:%M:%S %Z')
-                    )
+                    pub_date = self._normalize_datetime(parsedate_to_datetime(item.findtext('pubDate')))
                     
                     if start_time <= pub_date <= end_time:
-                        articles.append({
-                            'timestamp': pub_date,
-                            'source': 'google_news',
-                            'content': f"{item.title.text}\n{item.description.text if item.description else ''}"[:1000],
-                            'author': 'Unknown',
-                            'location': location,
-                            'coordinates': None,
-                            'engagement': {},
-                            'url': item.link.text,
-                            'data': {
+                        articles.append(OSINTRecord(
+                            timestamp=pub_date,
+                            source='google_news',
+                            content=f"{item.findtext('title', '')}\n{item.findtext('description', '')}"[:1000],
+                            author='Unknown',
+                            location=location,
+                            coordinates=None,
+                            engagement={},
+                            url=item.findtext('link'),
+                            data={
                                 'source_name': 'Google News',
-                                'guid': item.guid.text if item.guid else ''
+                                'guid': item.findtext('guid', '')
                             }
-                        })
+                        ))
                         
                 except Exception as e:
                     logger.debug(f"Error processing news item: {e}")
-                    continue
-                    
+                finally:
+                    item.clear()
+                    while item.getprevious() is not None:
+                        del item.getparent()[0]
+                
+                seen_items += 1
+                if seen_items >= item_limit:
+                    break
+            
+            # feed order is by relevance, not time
+            articles.sort(key=itemgetter('timestamp'))
             return articles
             
         except Exception as e:
             logger.error(f"Error with Google News: {e}")
             return []
     
-    def _get_geocode(self, location):
+    def geocode_location(self, location):
+        if not location:
+            return None
+        
+        key = ' '.join(location.lower().split())
+        with self._geocode_memo_lock:
+            entry = self._geocode_memo.get(key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    self._geocode_memo.move_to_end(key)
+                    return entry[1]
+                del self._geocode_memo[key]
+        
+        if self._geocode_cache is not None:
+            try:
+                cached, expires_at = self._geocode_cache.get(key, expire_time=True)
+                if cached is not None:
+                    self._remember_geocode(key, cached, expires_at)
+                    return cached
+            except Exception as e:
+                logger.warning(f"Geocode cache read failed for '{key}': {e}")
+        
         try:
             location_data = self.geolocator.geocode(location)
             if location_data:
-                return {
+                result = {
                     'lat': location_data.latitude,
                     'lon': location_data.longitude,
                     'address': location_data.address
                 }
+                ttl = self.config.GEOCODE_CACHE_TTL_HOURS * 3600
+                self._remember_geocode(key, result, time.time() + ttl)
+                
+                if self._geocode_cache is not None:
+                    try:
+                        self._geocode_cache.set(key, result, expire=ttl)
+                    except Exception as e:
+                        logger.warning(f"Geocode cache write failed for '{key}': {e}")
+                
+                return result
         except Exception as e:
             logger.error(f"Geocoding error: {e}")
         return None
     
-    def _extract_coordinates(self, tweet):
-        if hasattr(tweet, 'coordinates') and tweet.coordinates:
+    def _remember_geocode(self, key, result, expires_at):
+        if expires_at is None:
+            expires_at = time.time() + self.config.GEOCODE_CACHE_TTL_HOURS * 3600
+        with self._geocode_memo_lock:
+            self._geocode_memo[key] = (expires_at, result)
+            self._geocode_memo.move_to_end(key)
+            if len(self._geocode_memo) > _GEOCODE_MEMO_SIZE:
+                self._geocode_memo.popitem(last=False)
+    
+    def _extract_coordinates(self, tweet, place=None):
+        geo = getattr(tweet, 'geo', None)
+        point = geo.get('coordinates') if geo else None
+        if point:
+            lon, lat = point['coordinates']
             return {
-                'lat': tweet.coordinates['coordinates'][1],
-                'lon': tweet.coordinates['coordinates'][0]
+                'lat': lat,
+                'lon': lon
             }
-        elif hasattr(tweet, 'place') and tweet.place and tweet.place.bounding_box:
-            coords = tweet.place.bounding_box.coordinates[0]
-            center_lon = sum(coord[0] for coord in coords) / len(coords)
-            center_lat = sum(coord[1] for coord in coords) / len(coords)
-            return {'lat': center_lat, 'lon': center_lon}
+        place_geo = getattr(place, 'geo', None)
+        bbox = place_geo.get('bbox') if place_geo else None
+        if bbox:
+            west, south, east, north = bbox
+            return {'lat': (south + north) / 2, 'lon': (west + east) / 2}
         return None
     
     def collect_web_intelligence(self, forensic_context, location, start_time, end_time, keywords=None, context_notes=""):
@@ -364,20 +762,24 @@ class OSINTCollector:
             }
             
             if isinstance(forensic_context, list) and forensic_context:
-                file_types = list(set(event.get('file_type', 'unknown') for event in forensic_context))
-                event_types = list(set(event.get('event_type', 'unknown') for event in forensic_context))
-                suspicious_files = [
-                    event.get('file_path', '') for event in forensic_context
-                    if any(ext in event.get('file_path', '').lower() 
-                          for ext in ['.exe', '.bat', '.ps1', '.dll', '.scr', '.com'])
-                ]
+                file_types, event_types, suspicious_files = self._summarize_forensic_context(forensic_context)
                 
                 context.update({
                     'file_types': file_types,
                     'event_types': event_types,
-                    'suspicious_files': suspicious_files[:10]
+                    'suspicious_files': suspicious_files
                 })
             
+            cache_key = self._web_intel_cache_key(context, start_time, end_time)
+            if self._web_intel_cache is not None:
+                try:
+                    cached = self._web_intel_cache.get(cache_key)
+                    if cached is not None:
+                        logger.info(f"Using cached web intelligence results ({len(cached)} items)")
+                        return cached
+                except Exception as e:
+                    logger.warning(f"Web intelligence cache read failed: {e}")
+            
             logger.info("Starting advanced LLM-powered web intelligence collection with context notes")
             web_data = self.web_intelligence.collect_comprehensive_intelligence(
                 forensic_context=context,
@@ -385,6 +787,15 @@ class OSINTCollector:
                 start_time=start_time,
                 end_time=end_time
             )
+            web_data.sort(key=itemgetter('timestamp'))
+            
+            if web_data and self._web_intel_cache is not None:
+                try:
+                    self._web_intel_cache.set(
+                        cache_key, web_data, expire=self.config.WEB_INTEL_CACHE_TTL_HOURS * 3600
+                    )
+                except Exception as e:
+                    logger.warning(f"Web intelligence cache write failed: {e}")
             
             return web_data
             
@@ -392,31 +803,84 @@ class OSINTCollector:
             logger.error(f"Error collecting web intelligence: {e}")
             return []
     
+    def _summarize_forensic_context(self, forensic_context):
+        if len(forensic_context) > 1000:
+            # full-disk timelines: one columnar pass instead of three Python loops
+            import pandas as pd
+            
+            frame = pd.DataFrame.from_records(forensic_context, columns=['file_type', 'event_type', 'file_path'])
+            paths = frame['file_path'].fillna('').astype(str)
+            return (
+                sorted(frame['file_type'].fillna('unknown').unique().tolist()),
+                sorted(frame['event_type'].fillna('unknown').unique().tolist()),
+                paths[paths.str.contains(_SUSPICIOUS_EXT_RE, na=False)].head(10).tolist()
+            )
+        
+        file_types = sorted(set(event.get('file_type') or 'unknown' for event in forensic_context))
+        event_types = sorted(set(event.get('event_type') or 'unknown' for event in forensic_context))
+        suspicious_files = [
+            path for path in (event.get('file_path', '') for event in forensic_context)
+            if _SUSPICIOUS_EXT_RE.search(path)
+        ][:10]
+        return file_types, event_types, suspicious_files
+    
+    def _web_intel_cache_key(self, context, start_time, end_time):
+        # any change in the inputs produces a new key
+        state = dict(context)
+        state['keywords'] = sorted(context.get('keywords') or [])
+        state['start'] = str(start_time)
+        state['end'] = str(end_time)
+        payload = orjson.dumps(state, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        return hashlib.sha256(payload).hexdigest()
+    
     def collect_all_sources(self, location, start_time, end_time, keywords=None, subreddits=None, forensic_context=None):
-        all_data = []
+        return asyncio.run(self.collect_all_sources_async(
+            location, start_time, end_time, keywords, subreddits, forensic_context
+        ))
+    
+    async def collect_all_sources_async(self, location, start_time, end_time, keywords=None, subreddits=None, forensic_context=None):
+        async with self._async_http_client() as client:
+            return await self._collect_all_sources(
+                client, location, start_time, end_time, keywords, subreddits, forensic_context
+            )
+    
+    async def _collect_all_sources(self, client, location, start_time, end_time, keywords, subreddits, forensic_context):
+        source_runs = []
         
         logger.info(f"Collecting OSINT data for {location} from {start_time} to {end_time}")
 
-        twitter_data = self.collect_twitter_data(location, start_time, end_time, keywords)
-        all_data.extend(twitter_data)
-        logger.info(f"Collected {len(twitter_data)} Twitter posts")
-        
-        reddit_data = self.collect_reddit_data(location, start_time, end_time, subreddits, keywords)
-        all_data.extend(reddit_data)
-        logger.info(f"Collected {len(reddit_data)} Reddit posts")
-        
-        news_data = self.collect_news_data(location, start_time, end_time, keywords)
-        all_data.extend(news_data)
-        logger.info(f"Collected {len(news_data)} news articles")
+        # the collectors are independent and network bound, so run them side by side
+        tasks = {
+            'Twitter posts': asyncio.to_thread(self.collect_twitter_data, location, start_time, end_time, keywords),
+            'Reddit posts': asyncio.to_thread(self.collect_reddit_data, location, start_time, end_time, subreddits, keywords),
+            'news articles': self.collect_news_data_async(location, start_time, end_time, keywords, client)
+        }
 
         if self.config.WEB_SEARCH_ENABLE and forensic_context:
-            web_intelligence_data = self.collect_web_intelligence(
-                forensic_context, location, start_time, end_time, keywords
+            tasks['web intelligence items'] = asyncio.to_thread(
+                self.collect_web_intelligence, forensic_context, location, start_time, end_time, keywords
             )
-            all_data.extend(web_intelligence_data)
-            logger.info(f"Collected {len(web_intelligence_data)} web intelligence items")
         
-        all_data.sort(key=lambda x: x['timestamp'])
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        
+        for label, result in zip(tasks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error collecting {label}: {result}")
+                continue
+            source_runs.append(result)
+            logger.info(f"Collected {len(result)} {label}")
+        
+        # every collector returns its items in ascending time order
+        all_data = []
+        seen_urls = set()
+        for item in heapq.merge(*source_runs, key=itemgetter('timestamp')):
+            # the same story often shows up in more than one feed
+            url = item.get('url')
+            if url:
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+            all_data.append(item)
         logger.info(f"Total OSINT data collected: {len(all_data)} items")
         
         return all_data
@@ -1,17 +1,53 @@
+import asyncio
+import atexit
+import mmap
+import os
+import queue
+import shutil
+import tempfile
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Any
 import time
 import hashlib
-from urllib.parse import urlparse, urljoin
+from email.utils import parsedate_to_datetime
+import heapq
+import json
+from urllib.parse import urlparse, urljoin, urlunparse, parse_qsl, urlencode
+from functools import lru_cache
+from urllib.robotparser import RobotFileParser
 import re
+import unicodedata
+import weakref
 
 # web scraping stuff
 from bs4 import BeautifulSoup
 from newspaper import Article, Config as NewspaperConfig
-from readability import Document
-import markdownify
+from selectolax.parser import HTMLParser
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
 
 # search engine libraries
 from duckduckgo_search import DDGS
@@ -27,9 +63,241 @@ from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 
 from llm_client import OllamaClient
+from cache import open_cache
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_RE_INLINE_WS = re.compile(r'[ \t]+')
+_RE_BLANKLINES = re.compile(r'\n{3,}')
+_BOILERPLATE_TAGS = 'script,style,noscript,nav,footer,aside,header'
+_RE_JSON_OBJ = re.compile(r'\{.*\}', re.DOTALL)
+
+# pages shorter than this aren't worth analysing
+_MIN_CONTENT_LENGTH = 100
+
+# client-rendered app shells; a thin page carrying one of these needs a real browser
+_SPA_MARKERS_RE = re.compile(r'<div id=["\'](?:root|app|__next)["\']|window\.__(?:INITIAL_STATE|NUXT|APOLLO_STATE)__')
+
+# where the actual content usually lives on rendered pages
+_CONTENT_SELECTORS = (
+    'article', 'main', '.content', '.post', '.entry',
+    '.article-body', '.story-body', '#content'
+)
+
+# walks the selectors in priority order inside the page, so the text comes back in one round trip
+_CONTENT_TEXT_SCRIPT = """
+for (const selector of arguments[0]) {
+    const element = document.querySelector(selector);
+    if (element && element.innerText.trim()) {
+        return element.innerText;
+    }
+}
+return document.body ? document.body.innerText : '';
+"""
+
+# login walls, paywalls and JS-only apps that never yield usable article text
+_BLOCKED_DOMAINS = frozenset({
+    'facebook.com', 'linkedin.com', 'twitter.com', 'x.com', 'instagram.com',
+    'tiktok.com', 'pinterest.com', 'reddit.com', 'quora.com', 'nytimes.com',
+    'wsj.com', 'ft.com', 'bloomberg.com'
+})
+
+_ROBOTS_CACHE_SIZE = 512
+
+_TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'ref_src'})
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    return urlparse(url).netloc
+
+
+@lru_cache(maxsize=4096)
+def _normalize_url(url: str) -> str:
+    # the same article behind different marketing links should compare equal
+    parsed = urlparse(url)
+    query = [
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key not in _TRACKING_PARAMS
+    ]
+    netloc = parsed.netloc.lower().removeprefix('www.')
+    path = parsed.path.rstrip('/')
+    return urlunparse(parsed._replace(netloc=netloc, path=path, query=urlencode(query), fragment=''))
+
+
+_driver_paths = {}
+_driver_paths_lock = threading.Lock()
+
+_shared_sessions = {}
+_shared_sessions_lock = threading.Lock()
+
+
+def _configure_session(session: requests.Session, user_agent: str) -> requests.Session:
+    session.headers.update({
+        'User-Agent': user_agent,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+    })
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _get_shared_session(config) -> requests.Session:
+    # one pooled session per user agent, reused across collector instances; never cached, so
+    # search API results stay fresh and API keys in query strings never reach the disk
+    user_agent = config.BROWSER_USER_AGENT
+    with _shared_sessions_lock:
+        session = _shared_sessions.get(user_agent)
+        if session is None:
+            session = _configure_session(requests.Session(), user_agent)
+            _shared_sessions[user_agent] = session
+        return session
+
+
+def _page_cache_expiry(headers, default_ttl: timedelta) -> Optional[datetime]:
+    # freshness comes from the page's own headers, WEB_PAGE_CACHE_TTL_DAYS only when it gives none; None means don't store
+    now = datetime.now(timezone.utc)
+    directives = {}
+    for directive in headers.get('Cache-Control', '').lower().split(','):
+        name, _, value = directive.strip().partition('=')
+        if name:
+            directives[name] = value.strip('"')
+    
+    if 'no-store' in directives:
+        return None
+    if 'no-cache' in directives:
+        return now
+    if directives.get('max-age', '').isdigit():
+        return now + timedelta(seconds=int(directives['max-age']))
+    
+    expires = headers.get('Expires')
+    if expires:
+        try:
+            expires_at = parsedate_to_datetime(expires)
+        except (TypeError, ValueError):
+            return now
+        return expires_at if expires_at.tzinfo else expires_at.replace(tzinfo=timezone.utc)
+    
+    return now + default_ttl
+
+
+def _get_page_session(config) -> requests.Session:
+    # article pages only; _fetch_page drives its cache directly so the body cap still applies
+    if not REQUESTS_CACHE_AVAILABLE:
+        return _get_shared_session(config)
+    
+    key = ('pages', config.BROWSER_USER_AGENT)
+    with _shared_sessions_lock:
+        session = _shared_sessions.get(key)
+        if session is None:
+            session = _configure_session(
+                requests_cache.CachedSession(
+                    cache_name=os.path.join(config.CACHE_DIR, 'web_pages'),
+                    backend='sqlite',
+                    expire_after=timedelta(days=config.WEB_PAGE_CACHE_TTL_DAYS),
+                    cache_control=True,
+                    stale_if_error=True
+                ),
+                config.BROWSER_USER_AGENT
+            )
+            _shared_sessions[key] = session
+        return session
+
+
+def _close_sessions():
+    with _shared_sessions_lock:
+        for session in _shared_sessions.values():
+            try:
+                session.close()
+            except Exception:
+                pass
+        _shared_sessions.clear()
+
+
+atexit.register(_close_sessions)
+
+
+def _resolve_driver_path(config, browser: str, manager_cls) -> str:
+    # the driver manager does a version check on every install(); remember the answer in memory and on disk
+    with _driver_paths_lock:
+        path = _driver_paths.get(browser)
+        if path and os.path.exists(path):
+            return path
+        
+        disk_cache = open_cache(config, 'drivers')
+        if disk_cache is not None:
+            try:
+                path = disk_cache.get(browser)
+            except Exception as e:
+                logger.warning(f"Driver path cache read failed: {e}")
+                path = None
+        
+        if not path or not os.path.exists(path):
+            path = manager_cls().install()
+            if disk_cache is not None:
+                try:
+                    # re-resolve daily so browser upgrades still pick up a matching driver
+                    disk_cache.set(browser, path, expire=86400)
+                except Exception as e:
+                    logger.warning(f"Driver path cache write failed: {e}")
+        
+        if disk_cache is not None:
+            disk_cache.close()
+        
+        _driver_paths[browser] = path
+        return path
+
+
+class _PooledArticle(Article):
+    # newspaper article that downloads through our pooled, cached session instead of its own requests call
+    def __init__(self, url: str, fetch: Callable[[str], str], **kwargs):
+        super().__init__(url, **kwargs)
+        self._fetch = fetch
+    
+    def download(self, input_html=None, title=None, recursion_counter=0):
+        if input_html is None:
+            input_html = self._fetch(self.url)
+        super().download(input_html=input_html, title=title, recursion_counter=recursion_counter)
+
+
+def get_full_content(result: Dict[str, Any]) -> str:
+    # full page text is spooled to disk; map it back in only when someone asks for it, then drop the file
+    if 'full_content' in result:
+        return result['full_content']
+    
+    path = result.pop('full_content_path', None)
+    if not path or not os.path.exists(path):
+        return result.get('content', '')
+    
+    with open(path, 'rb') as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            text = ''
+        else:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = mapped[:].decode('utf-8', errors='replace')
+    
+    _discard_spooled(path)
+    result['full_content'] = text
+    return text
+
+
+def _discard_spooled(path: Optional[str]):
+    if path:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
 class WebIntelligenceCollector:
     def __init__(self, config):
         self.config = config
@@ -39,19 +307,39 @@ class WebIntelligenceCollector:
         self.newspaper_config = NewspaperConfig()
         self.newspaper_config.browser_user_agent = config.BROWSER_USER_AGENT
         self.newspaper_config.request_timeout = config.WEB_SCRAPE_TIMEOUT
+        # we only want the text, so skip the top-image downloads and the article memo file
+        self.newspaper_config.fetch_images = False
+        self.newspaper_config.memoize_articles = False
+        
+        # persistent session for better performance, also used for newspaper's downloads
+        self.session = _get_shared_session(config)
+        self.page_session = _get_page_session(config)
+        # selenium renders aren't covered by the HTTP cache
+        self._browser_cache = open_cache(config, 'browser_pages')
+        
+        # long-lived browsers handed out to page workers instead of a fresh Chrome per URL
+        self._idle_drivers = queue.Queue()
+        self._drivers = []
+        self._driver_slots = 0
+        self._drivers_lock = threading.Lock()
         
-        # persistent session for better performance
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': config.BROWSER_USER_AGENT,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Cache-Control': 'no-cache',
-        })
+        # spooled page text belongs to this collector: files go as their results are dropped or read,
+        # anything left goes with the collector, on close() or at exit
+        self._spool_dir = tempfile.mkdtemp(prefix='sift_web_')
+        self._spool_finalizer = weakref.finalize(self, shutil.rmtree, self._spool_dir, ignore_errors=True)
         
-        self.driver = None
+        # WEB_SEARCH_ENGINE may name several engines, comma separated; they are queried side by side
+        self.search_engines = {
+            'duckduckgo': self._search_duckduckgo,
+            'google': self._search_google_api,
+            'brave': self._search_brave,
+        }
+        
+        # domains seen serving JS app shells, the only ones worth a Selenium render
+        self._js_heavy_domains = set()
+        
+        self._robots = OrderedDict()
+        self._robots_lock = threading.Lock()
         
     def collect_web_intelligence(self, forensic_context: Dict, location: str = "", start_time: datetime = None, end_time: datetime = None) -> List[Dict[str, Any]]:
         # this is the main intelligence gathering function
@@ -71,42 +359,88 @@ class WebIntelligenceCollector:
         
         logger.info(f"Generated {len(search_queries)} intelligent search queries")
         
-        all_results = []
+        extracted_results = asyncio.run(self._collect_results(search_queries))
+        
+        # clean up duplicates before they cost an LLM call, then rank by relevance
+        unique_results = self._deduplicate_results(extracted_results)
+        analyzed_results = [
+            result for result in self._analyze_results(unique_results, forensic_context)
+            if result.get('relevance_score', 0) > 3
+        ]
+        logger.info(f"Collected {len(analyzed_results)} unique web intelligence items")
+        
+        # only the top MAX_OSINT_RESULTS are kept, so there's no need to sort the rest
+        top_results = heapq.nlargest(
+            self.config.MAX_OSINT_RESULTS, analyzed_results, key=lambda x: x.get('relevance_score', 0)
+        )
+        
+        # pages dropped as duplicates, low relevance or past the cap don't need their spooled text
+        kept = {id(result) for result in top_results}
+        for result in extracted_results:
+            if id(result) not in kept:
+                _discard_spooled(result.pop('full_content_path', None))
+        
+        return top_results
+    
+    async def _collect_results(self, search_queries: List[str]) -> List[Dict[str, Any]]:
+        # search hits are queued the moment the engine yields them and a pool of workers scrapes them;
+        # each page fetch is blocking so it gets a thread
+        loop = asyncio.get_running_loop()
+        pending = asyncio.Queue()
+        host_slots = defaultdict(lambda: asyncio.Semaphore(self.config.WEB_SCRAPE_PER_HOST))
+        search_lock = asyncio.Lock()
+        last_search = [0.0]
+        seen_urls = set()
+        extracted = []
+        
+        def enqueue(claimed, result):
+            # only the top results of each query get scraped, skipping pages another query already claimed
+            url = result.get('url')
+            if url and claimed[0] < self.config.WEB_SCRAPE_MAX_PAGES and _normalize_url(url) not in seen_urls:
+                seen_urls.add(_normalize_url(url))
+                claimed[0] += 1
+                pending.put_nowait(result)
         
-        for query in search_queries:
+        async def run_query(query):
             try:
-                logger.info(f"Searching for: {query}")
-                
-                # try different search engines
-                search_results = self._search_web(query)
-                
-                # grab the content from promising results
-                analyzed_results = []
-                for result in search_results[:self.config.WEB_SCRAPE_MAX_PAGES]:
-                    try:
-                        content_data = self._extract_and_analyze_content(result, forensic_context)
-                        if content_data and content_data.get('relevance_score', 0) > 3:
-                            analyzed_results.append(content_data)
-                    except Exception as e:
-                        logger.debug(f"Error processing result {result.get('url', 'unknown')}: {e}")
-                        continue
+                # don't hammer the search engines
+                async with search_lock:
+                    await asyncio.sleep(max(0, last_search[0] + 1 - time.monotonic()))
+                    last_search[0] = time.monotonic()
                 
-                all_results.extend(analyzed_results)
+                logger.info(f"Searching for: {query}")
+                claimed = [0]
                 
-                # don't hammer the search engines
-                time.sleep(1)
+                # engines call back from their own threads, so hand each hit over to the loop
+                await asyncio.to_thread(
+                    self._search_web, query, lambda result: loop.call_soon_threadsafe(enqueue, claimed, result)
+                )
                 
             except Exception as e:
                 logger.error(f"Error processing query '{query}': {e}")
-                continue
         
-        # clean up duplicates and rank by relevance
-        unique_results = self._deduplicate_results(all_results)
-        ranked_results = sorted(unique_results, key=lambda x: x.get('relevance_score', 0), reverse=True)
+        async def extract_worker():
+            while True:
+                result = await pending.get()
+                try:
+                    async with host_slots[_netloc(result['url'])]:
+                        content_data = await asyncio.to_thread(self._extract_content, result)
+                    if content_data:
+                        extracted.append(content_data)
+                except Exception as e:
+                    logger.debug(f"Error processing result {result.get('url', 'unknown')}: {e}")
+                finally:
+                    pending.task_done()
         
-        logger.info(f"Collected {len(ranked_results)} unique web intelligence items")
+        workers = [asyncio.create_task(extract_worker()) for _ in range(self.config.WEB_SCRAPE_CONCURRENCY)]
+        try:
+            await asyncio.gather(*(run_query(query) for query in search_queries))
+            await pending.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
         
-        return ranked_results[:self.config.MAX_OSINT_RESULTS]
+        return extracted
     
     def _generate_contextual_search_queries(self, forensic_context: Dict, location: str, start_time: datetime, end_time: datetime) -> List[str]:
         if not self.llm_client or not self.llm_client.is_available():
@@ -165,80 +499,199 @@ class WebIntelligenceCollector:
         
         return queries[:10]
     
-    def _search_web(self, query: str) -> List[Dict[str, Any]]:
-        # do the actual web search
+    def _search_web(self, query: str, on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        # do the actual web search, handing each hit to on_result as soon as it arrives
         
-        if self.config.WEB_SEARCH_ENGINE.lower() == 'duckduckgo':
-            return self._search_duckduckgo(query)
-        else:
-            logger.warning(f"Unsupported search engine: {self.config.WEB_SEARCH_ENGINE}")
+        engines = []
+        for name in self.config.WEB_SEARCH_ENGINE.lower().split(','):
+            name = name.strip()
+            if name in self.search_engines:
+                # keyless API engines would only return [] and still take a share of the budget
+                if self._search_engine_configured(name):
+                    engines.append(self.search_engines[name])
+                else:
+                    logger.debug(f"Skipping search engine {name}: no API key configured")
+            elif name:
+                logger.warning(f"Unsupported search engine: {name}")
+        
+        if not engines:
+            return []
+        
+        # the result budget is shared between the engines
+        max_results = max(1, self.config.WEB_SEARCH_MAX_RESULTS // len(engines))
+        
+        with ThreadPoolExecutor(max_workers=len(engines)) as executor:
+            futures = [executor.submit(engine, query, max_results, on_result) for engine in engines]
+            engine_results = []
+            for future in futures:
+                try:
+                    engine_results.append(future.result())
+                except Exception as e:
+                    logger.error(f"Search engine error: {e}")
+        
+        # merge, keeping the first engine's copy of any shared URL
+        results = []
+        seen_urls = set()
+        for result in (result for results_list in engine_results for result in results_list):
+            key = _normalize_url(result['url']) if result.get('url') else None
+            if key and key not in seen_urls:
+                seen_urls.add(key)
+                results.append(result)
+        
+        return results
+    
+    def _search_engine_configured(self, name: str) -> bool:
+        if name == 'google':
+            return bool(self.config.GOOGLE_SEARCH_API_KEY and self.config.GOOGLE_SEARCH_ENGINE_ID)
+        if name == 'brave':
+            return bool(self.config.BRAVE_SEARCH_API_KEY)
+        return True
+    
+    def _search_google_api(self, query: str, max_results: int, on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        # Google Custom Search JSON API, only when a key and engine id are configured
+        if not self.config.GOOGLE_SEARCH_API_KEY or not self.config.GOOGLE_SEARCH_ENGINE_ID:
+            return []
+        
+        results = []
+        
+        try:
+            response = self.session.get(
+                'https://www.googleapis.com/customsearch/v1',
+                params={
+                    'key': self.config.GOOGLE_SEARCH_API_KEY,
+                    'cx': self.config.GOOGLE_SEARCH_ENGINE_ID,
+                    'q': query,
+                    'num': min(10, max_results)
+                },
+                timeout=self.config.WEB_SEARCH_TIMEOUT
+            )
+            response.raise_for_status()
+            
+            for item in response.json().get('items', []):
+                result = {
+                    'title': item.get('title', ''),
+                    'url': item.get('link', ''),
+                    'snippet': item.get('snippet', ''),
+                    'source': 'google_api'
+                }
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+                    
+        except Exception as e:
+            logger.error(f"Google API search error: {e}")
+        
+        return results
+    
+    def _search_brave(self, query: str, max_results: int, on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        # Brave Search API, only when a subscription token is configured
+        if not self.config.BRAVE_SEARCH_API_KEY:
             return []
+        
+        results = []
+        
+        try:
+            response = self.session.get(
+                'https://api.search.brave.com/res/v1/web/search',
+                params={'q': query, 'count': min(20, max_results), 'freshness': 'py'},
+                headers={'Accept': 'application/json', 'X-Subscription-Token': self.config.BRAVE_SEARCH_API_KEY},
+                timeout=self.config.WEB_SEARCH_TIMEOUT
+            )
+            response.raise_for_status()
+            
+            for item in response.json().get('web', {}).get('results', []):
+                result = {
+                    'title': item.get('title', ''),
+                    'url': item.get('url', ''),
+                    'snippet': item.get('description', ''),
+                    'source': 'brave'
+                }
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+                    
+        except Exception as e:
+            logger.error(f"Brave search error: {e}")
+        
+        return results
     
-    def _search_duckduckgo(self, query: str) -> List[Dict[str, Any]]:
+    def _search_duckduckgo(self, query: str, max_results: int, on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
         # use DuckDuckGo for the search
         results = []
         
         try:
             with DDGS() as ddgs:
-                ddg_results = list(ddgs.text(
+                for result in ddgs.text(
                     keywords=query,
-                    max_results=self.config.WEB_SEARCH_MAX_RESULTS,
+                    max_results=max_results,
                     timelimit='y',  # only last year's results
                     safesearch='off'
-                ))
-                
-                for result in ddg_results:
-                    results.append({
+                ):
+                    item = {
                         'title': result.get('title', ''),
                         'url': result.get('href', ''),
                         'snippet': result.get('body', ''),
                         'source': 'duckduckgo'
-                    })
+                    }
+                    results.append(item)
+                    if on_result is not None:
+                        on_result(item)
                     
         except Exception as e:
             logger.error(f"DuckDuckGo search error: {e}")
         
         return results
     
-    def _extract_and_analyze_content(self, search_result: Dict, forensic_context: Dict) -> Optional[Dict[str, Any]]:
-        # grab content from the page and have LLM analyze it
+    def _analyze_results(self, results: List[Dict[str, Any]], forensic_context: Dict) -> List[Dict[str, Any]]:
+        # have the LLM take a look at what we found, a batch of pages per prompt
+        if not results or not self.llm_client or not self.llm_client.is_available():
+            return results
+        
+        try:
+            analyses = self.llm_client.analyze_web_content_batch(
+                # the batch prompt only reads the head of each page, which the in-memory preview covers
+                [result['content'] for result in results],
+                context=str(forensic_context),
+                question="How does this content relate to digital forensic evidence?"
+            )
+        except Exception as e:
+            logger.debug(f"LLM analysis failed: {e}")
+            return results
+        
+        for result, analysis in zip(results, analyses):
+            if analysis:
+                result['analysis'] = analysis
+                result['relevance_score'] = analysis.get('correlation_potential', 5)
+        
+        return results
+    
+    def _extract_content(self, search_result: Dict) -> Optional[Dict[str, Any]]:
+        # grab content from the page, analysis happens later in batches
         
         url = search_result.get('url', '')
         if not url:
             return None
         
+        # cheap URL checks before any of the extraction fallbacks fire
+        if self._is_blocked_domain(url) or not self._robots_allowed(url):
+            logger.debug(f"Skipping {url}: blocked domain or disallowed by robots.txt")
+            return None
+        
         try:
+            # stop at the first step that gives us enough text
             content = self._extract_with_newspaper(url)
             
-            if not content:
+            if not content or len(content) < _MIN_CONTENT_LENGTH:
                 # try basic scraping if newspaper fails
                 content = self._extract_with_requests(url)
             
-            if not content:
-                # fire up selenium for the really tricky sites
+            if (not content or len(content) < _MIN_CONTENT_LENGTH) and _netloc(url) in self._js_heavy_domains:
+                # fire up selenium only for sites known to render client side
                 content = self._extract_with_browser(url)
             
-            if not content or len(content) < 100:
+            if not content or len(content) < _MIN_CONTENT_LENGTH:
                 return None
             
-            # have the LLM take a look at what we found
-            analysis = None
-            relevance_score = 5  # middle of the road default
-            
-            if self.llm_client and self.llm_client.is_available():
-                try:
-                    analysis = self.llm_client.analyze_web_content(
-                        content=content,
-                        context=str(forensic_context),
-                        question="How does this content relate to digital forensic evidence?"
-                    )
-                    
-                    if analysis:
-                        relevance_score = analysis.get('correlation_potential', 5)
-                        
-                except Exception as e:
-                    logger.debug(f"LLM analysis failed for {url}: {e}")
-            
             # put together the final result
             result = {
                 'timestamp': datetime.now(),
@@ -246,17 +699,17 @@ class WebIntelligenceCollector:
                 'url': url,
                 'title': search_result.get('title', ''),
                 'content': content[:2000],  # keep it reasonable size
-                'full_content': content,
+                'full_content_path': self._spool_content(content),
                 'snippet': search_result.get('snippet', ''),
-                'relevance_score': relevance_score,
+                'relevance_score': 5,  # middle of the road default until the LLM weighs in
                 'extraction_method': 'newspaper',
-                'analysis': analysis,
+                'analysis': None,
                 'author': 'Web Intelligence',
                 'location': '',  # maybe fill this in later with geolocation
                 'coordinates': None,
                 'engagement': {},
                 'data': {
-                    'domain': urlparse(url).netloc,
+                    'domain': _netloc(url),
                     'content_length': len(content),
                     'extraction_timestamp': datetime.now().isoformat()
                 }
@@ -268,10 +721,124 @@ class WebIntelligenceCollector:
             logger.error(f"Error extracting content from {url}: {e}")
             return None
     
+    def _is_blocked_domain(self, url: str) -> bool:
+        host = _netloc(url).rpartition('@')[2].split(':')[0]
+        parts = host.lower().split('.')
+        # match the domain itself and any subdomain of it
+        return any('.'.join(parts[i:]) in _BLOCKED_DOMAINS for i in range(len(parts) - 1))
+    
+    def _robots_allowed(self, url: str) -> bool:
+        parsed = urlparse(url)
+        netloc = parsed.netloc.lower()
+        
+        with self._robots_lock:
+            parser = self._robots.get(netloc)
+            if parser is not None:
+                self._robots.move_to_end(netloc)
+        
+        if parser is None:
+            parser = RobotFileParser()
+            try:
+                response = self.session.get(
+                    f"{parsed.scheme}://{parsed.netloc}/robots.txt",
+                    timeout=self.config.WEB_SCRAPE_TIMEOUT
+                )
+                # same rules as RobotFileParser.read
+                if response.status_code in (401, 403):
+                    parser.disallow_all = True
+                elif response.status_code >= 400:
+                    parser.allow_all = True
+                else:
+                    parser.parse(response.text.splitlines())
+            except Exception as e:
+                logger.debug(f"Could not read robots.txt for {netloc}: {e}")
+                parser.allow_all = True
+            
+            with self._robots_lock:
+                self._robots[netloc] = parser
+                if len(self._robots) > _ROBOTS_CACHE_SIZE:
+                    self._robots.popitem(last=False)
+        
+        return parser.can_fetch(self.config.BROWSER_USER_AGENT, url)
+    
+    def _spool_content(self, content: str) -> str:
+        with tempfile.NamedTemporaryFile('wb', dir=self._spool_dir, suffix='.txt', delete=False) as handle:
+            handle.write(content.encode('utf-8', errors='replace'))
+            return handle.name
+    
+    def _fetch_page(self, url: str) -> str:
+        # only the first WEB_SCRAPE_MAX_BYTES are ever read, however large the page claims to be
+        limit = self.config.WEB_SCRAPE_MAX_BYTES
+        page_cache = getattr(self.page_session, 'cache', None)
+        cache_key = None
+        cached = None
+        headers = {}
+        
+        if page_cache is not None:
+            try:
+                cache_key = page_cache.create_key(requests.Request('GET', url).prepare())
+                cached = page_cache.get_response(cache_key)
+            except Exception as e:
+                logger.debug(f"Page cache read failed for {url}: {e}")
+                page_cache = None
+            
+            if cached is not None:
+                if not cached.is_expired:
+                    return cached.content[:limit].decode(cached.encoding or 'utf-8', errors='replace')
+                
+                # stale copy: ask the server whether it changed instead of downloading it again
+                if cached.headers.get('ETag'):
+                    headers['If-None-Match'] = cached.headers['ETag']
+                if cached.headers.get('Last-Modified'):
+                    headers['If-Modified-Since'] = cached.headers['Last-Modified']
+        
+        # fetched outside the cached session, which would otherwise read the whole body before we can cap it
+        response = self.session.get(
+            url,
+            headers=headers,
+            timeout=self.config.WEB_SCRAPE_TIMEOUT,
+            allow_redirects=True,
+            stream=True
+        )
+        try:
+            default_ttl = timedelta(days=self.config.WEB_PAGE_CACHE_TTL_DAYS)
+            
+            if response.status_code == 304 and cached is not None:
+                expires = _page_cache_expiry(response.headers, default_ttl) or datetime.now(timezone.utc)
+                try:
+                    page_cache.save_response(cached, cache_key=cache_key, expires=expires)
+                except Exception as e:
+                    logger.debug(f"Could not refresh cached {url}: {e}")
+                return cached.content[:limit].decode(cached.encoding or 'utf-8', errors='replace')
+            
+            response.raise_for_status()
+            
+            # read one byte past the cap so a body that fits is told apart from a truncated one
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                body.extend(chunk)
+                if len(body) > limit:
+                    break
+            
+            if page_cache is not None and len(body) <= limit:
+                expires = _page_cache_expiry(response.headers, default_ttl)
+                revalidatable = response.headers.get('ETag') or response.headers.get('Last-Modified')
+                if expires is not None and (expires > datetime.now(timezone.utc) or revalidatable):
+                    # the body was streamed, hand it back to the response so the cache can store it
+                    response._content = bytes(body)
+                    try:
+                        page_cache.save_response(response, cache_key=cache_key, expires=expires)
+                    except Exception as e:
+                        logger.debug(f"Could not cache {url}: {e}")
+            
+            return bytes(body[:limit]).decode(response.encoding or 'utf-8', errors='replace')
+        finally:
+            response.close()
+    
     def _extract_with_newspaper(self, url: str) -> Optional[str]:
         # try to get clean article text with newspaper3k
         try:
-            article = Article(url, config=self.newspaper_config)
+            article = _PooledArticle(url, self._fetch_page, config=self.newspaper_config)
             article.download()
             article.parse()
             
@@ -289,25 +856,26 @@ class WebIntelligenceCollector:
     def _extract_with_requests(self, url: str) -> Optional[str]:
         # fallback to basic scraping
         try:
-            response = self.session.get(
-                url, 
-                timeout=self.config.WEB_SCRAPE_TIMEOUT,
-                allow_redirects=True
-            )
-            response.raise_for_status()
+            html = self._fetch_page(url)
             
-            # readability helps clean up the HTML mess
-            doc = Document(response.text)
-            clean_html = doc.summary()
+            # one C-level parse, drop the page chrome and keep the text
+            tree = HTMLParser(html)
+            for node in tree.css(_BOILERPLATE_TAGS):
+                node.decompose()
             
-            # markdown is easier to work with
-            text_content = markdownify.markdownify(clean_html)
+            root = tree.body or tree.root
+            if root is None:
+                return None
+            text_content = root.text(separator='\n', strip=True)
             
             # tidy up the extracted text
-            text_content = re.sub(r'\n\s*\n', '\n\n', text_content)
-            text_content = re.sub(r'[^\S\r\n]+', ' ', text_content)
+            text_content = _RE_INLINE_WS.sub(' ', text_content)
+            text_content = _RE_BLANKLINES.sub('\n\n', text_content).strip()
             
-            return text_content.strip()
+            if len(text_content) < 500 and _SPA_MARKERS_RE.search(html):
+                self._js_heavy_domains.add(_netloc(url))
+            
+            return text_content
             
         except Exception as e:
             logger.debug(f"Requests extraction failed for {url}: {e}")
@@ -316,55 +884,97 @@ class WebIntelligenceCollector:
     
     def _extract_with_browser(self, url: str) -> Optional[str]:
         # selenium time - for the JavaScript heavy sites
-        if not self._setup_browser():
+        if self._browser_cache is not None:
+            try:
+                cached = self._browser_cache.get(url)
+                if cached is not None:
+                    return cached
+            except Exception as e:
+                logger.warning(f"Browser page cache read failed: {e}")
+        
+        content = self._extract_with_driver(url)
+        
+        if content and self._browser_cache is not None:
+            try:
+                self._browser_cache.set(url, content, expire=self.config.WEB_PAGE_CACHE_TTL_DAYS * 86400)
+            except Exception as e:
+                logger.warning(f"Browser page cache write failed: {e}")
+        
+        return content
+    
+    def _extract_with_driver(self, url: str) -> Optional[str]:
+        driver = self._acquire_driver()
+        if driver is None:
             return None
         
         try:
-            self.driver.get(url)
+            driver.get(url)
             
             # give the page time to fully load
-            WebDriverWait(self.driver, self.config.BROWSER_TIMEOUT).until(
+            WebDriverWait(driver, self.config.BROWSER_TIMEOUT).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
-            # look for the actual content sections
-            content_selectors = [
-                'article', 'main', '.content', '.post', '.entry',
-                '.article-body', '.story-body', '#content'
-            ]
-            
-            content = ""
-            for selector in content_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        content = elements[0].text
-                        break
-                except:
-                    continue
-            
-            # if nothing else works, grab everything
-            if not content:
-                content = self.driver.find_element(By.TAG_NAME, "body").text
-            
-            return content
+            # first matching content section, or the whole body if nothing else works
+            return driver.execute_script(_CONTENT_TEXT_SCRIPT, list(_CONTENT_SELECTORS))
             
         except Exception as e:
             logger.debug(f"Browser extraction failed for {url}: {e}")
             return None
         finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                    self.driver = None
-                except:
-                    pass
+            self._release_driver(driver)
     
-    def _setup_browser(self) -> bool:
-        # configure Chrome for scraping
-        if self.driver:
-            return True
+    def _acquire_driver(self):
+        if self.config.BROWSER_POOL_SIZE < 1:
+            return None
+        
+        while True:
+            try:
+                return self._idle_drivers.get_nowait()
+            except queue.Empty:
+                pass
+            
+            # only the slot is taken under the lock, browser startup takes seconds
+            with self._drivers_lock:
+                reserved = self._driver_slots < self.config.BROWSER_POOL_SIZE
+                if reserved:
+                    self._driver_slots += 1
+            
+            if reserved:
+                driver = self._setup_browser()
+                with self._drivers_lock:
+                    if driver is None:
+                        self._driver_slots -= 1
+                    else:
+                        self._drivers.append(driver)
+                return driver
+            
+            # pool is full, wait for another worker to hand one back or for a failed startup to free its slot
+            try:
+                return self._idle_drivers.get(timeout=1)
+            except queue.Empty:
+                pass
+    
+    def _release_driver(self, driver):
+        with self._drivers_lock:
+            pooled = driver in self._drivers
+        if not pooled:
+            # the pool was closed while this browser was out
+            try:
+                driver.quit()
+            except:
+                pass
+            return
         
+        # reset state between pages rather than restarting the browser
+        try:
+            driver.delete_all_cookies()
+        except Exception as e:
+            logger.debug(f"Could not clear browser cookies: {e}")
+        self._idle_drivers.put(driver)
+    
+    def _setup_browser(self):
+        # configure Chrome for scraping
         try:
             chrome_options = ChromeOptions()
             chrome_options.add_argument('--no-sandbox')
@@ -373,64 +983,93 @@ class WebIntelligenceCollector:
             chrome_options.add_argument('--disable-web-security')
             chrome_options.add_argument('--disable-features=VizDisplayCompositor')
             chrome_options.add_argument(f'--user-agent={self.config.BROWSER_USER_AGENT}')
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_argument('--disable-extensions')
+            chrome_options.add_argument('--disable-background-networking')
+            # we only read text, so don't wait on images and other subresources
+            chrome_options.page_load_strategy = 'eager'
             
             if self.config.BROWSER_HEADLESS:
                 chrome_options.add_argument('--headless')
             
             # Chrome is usually more reliable
             try:
-                self.driver = webdriver.Chrome(
-                    service=webdriver.chrome.service.Service(ChromeDriverManager().install()),
+                return webdriver.Chrome(
+                    service=webdriver.chrome.service.Service(
+                        _resolve_driver_path(self.config, 'chrome', ChromeDriverManager)
+                    ),
                     options=chrome_options
                 )
-                return True
             except Exception as e:
                 logger.debug(f"Chrome setup failed: {e}")
             
             # Firefox as backup option
             firefox_options = FirefoxOptions()
+            firefox_options.page_load_strategy = 'eager'
             if self.config.BROWSER_HEADLESS:
                 firefox_options.add_argument('--headless')
             
             try:
-                self.driver = webdriver.Firefox(
-                    service=webdriver.firefox.service.Service(GeckoDriverManager().install()),
+                return webdriver.Firefox(
+                    service=webdriver.firefox.service.Service(
+                        _resolve_driver_path(self.config, 'firefox', GeckoDriverManager)
+                    ),
                     options=firefox_options
                 )
-                return True
             except Exception as e:
                 logger.debug(f"Firefox setup failed: {e}")
                 
         except Exception as e:
             logger.error(f"Browser setup failed: {e}")
         
-        return False
+        return None
     
     def _deduplicate_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         # get rid of duplicate results
         seen_urls = set()
         seen_hashes = set()
         unique_results = []
+        lsh = MinHashLSH(threshold=0.85, num_perm=64) if DATASKETCH_AVAILABLE else None
         
-        for result in results:
-            url = result.get('url', '')
+        for index, result in enumerate(results):
+            url = _normalize_url(result.get('url', ''))
             content = result.get('content', '')
             
-            # already processed this URL
+            # already processed this URL, nothing to hash
             if url in seen_urls:
                 continue
+            seen_urls.add(url)
             
-            # hash the content to catch near-duplicates
-            content_hash = hashlib.md5(content.encode('utf-8', errors='ignore')).hexdigest()
+            # exact copies are cheap to catch with a hash
+            content_hash = hashlib.blake2b(content.encode('utf-8', errors='ignore'), digest_size=16).digest()
             if content_hash in seen_hashes:
                 continue
             
-            seen_urls.add(url)
+            # wire copy with a different byline or ad block still lands in the same LSH bucket
+            if lsh is not None:
+                signature = self._content_minhash(content)
+                if signature is not None:
+                    if lsh.query(signature):
+                        continue
+                    lsh.insert(str(index), signature)
+            
             seen_hashes.add(content_hash)
             unique_results.append(result)
         
         return unique_results
     
+    def _content_minhash(self, content: str):
+        normalized = unicodedata.normalize('NFKD', content).lower()
+        tokens = _TOKEN_RE.findall(normalized)
+        if len(tokens) < 5:
+            return None
+        
+        signature = MinHash(num_perm=64)
+        signature.update_batch(
+            ' '.join(tokens[i:i + 5]).encode('utf-8') for i in range(len(tokens) - 4)
+        )
+        return signature
+    
     def analyze_web_trend(self, search_queries: List[str], location: str) -> Dict[str, Any]:
         # let the LLM analyze trends in what we found
         
@@ -471,19 +1110,38 @@ Provide trend analysis as JSON:"""
         try:
             response = self.llm_client.generate(prompt, system_prompt, max_tokens=2048)
             if response:
-                import json
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
+                json_match = _RE_JSON_OBJ.search(response)
                 if json_match:
-                    return json.loads(json_match.group())
+                    return _loads(json_match.group())
         except Exception as e:
             logger.error(f"Error analyzing web trends: {e}")
         
         return {"error": "Failed to analyze web trends"}
     
-    def __del__(self):
-        # clean up selenium stuff
-        if hasattr(self, 'driver') and self.driver:
+    def _quit_drivers(self):
+        # clean up selenium stuff; workers may still hold the queue, so drain it rather than replace it
+        with self._drivers_lock:
+            drivers = self._drivers
+            self._drivers = []
+            self._driver_slots -= len(drivers)
+        
+        while True:
+            try:
+                self._idle_drivers.get_nowait()
+            except queue.Empty:
+                break
+        
+        for driver in drivers:
             try:
-                self.driver.quit()
+                driver.quit()
             except:
                 pass
+    
+    def close(self):
+        self._quit_drivers()
+        self._spool_finalizer()
+    
+    def __del__(self):
+        # results handed out may still point into the spool, so only the browsers go here
+        if hasattr(self, '_drivers'):
+            self._quit_drivers()
@@ -1,31 +1,87 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, session
+from flask import Flask, Response, render_template, request, jsonify, redirect, url_for, session, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+import atexit
 import json
+import multiprocessing
+import orjson
 import logging
 from datetime import datetime, timedelta
 import os
-import folium
-import plotly.graph_objs as go
-import plotly.utils
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import numpy as np
 from werkzeug.utils import secure_filename
 from dateutil.parser import parse as parse_date
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.targets import BaseTarget, MultipleTargets, ValueTarget
 
+from cache import open_cache
 from config import config
 from database import DatabaseManager
-from forensics import ForensicAnalyzer
+from forensics import parse_evidence_file
 from osint import OSINTCollector
 from correlation import CorrelationEngine
 from ollama_manager import OllamaModelManager
 
 logger = logging.getLogger(__name__)
 
+OSINT_MARKER_COLORS = {
+    'twitter': 'blue',
+    'reddit': 'orange',
+    'news_api': 'green',
+    'google_news': 'red'
+}
+
+OSINT_MARKER_CALLBACK = """
+function (row) {
+    var icon = L.AwesomeMarkers.icon({markerColor: row[3]});
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    marker.bindPopup(row[2], {maxWidth: 300});
+    return marker;
+}
+"""
+
+EVIDENCE_DIR = 'evidence'
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MAX_TRACKED_TASKS = 256
+LLM_STATUS_TTL_SECONDS = 10
+
+class OrjsonProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__, template_folder='../templates', static_folder='../static')
+app.json = OrjsonProvider(app)
 app.secret_key = config.FLASK_SECRET_KEY
 
-db_manager = DatabaseManager(config.DATABASE_PATH)
-forensic_analyzer = ForensicAnalyzer()
-osint_collector = OSINTCollector(config)
-correlation_engine = CorrelationEngine(config)
-ollama_manager = OllamaModelManager(config)
+# spawned parse workers re-run this file as __mp_main__; they only need forensics, so the
+# services, caches and pools are built in the serving process alone
+_IS_PARSE_WORKER = __name__ == '__mp_main__'
+
+if not _IS_PARSE_WORKER:
+    db_manager = DatabaseManager(config.DATABASE_PATH)
+    osint_collector = OSINTCollector(config)
+    correlation_engine = CorrelationEngine(config)
+    ollama_manager = OllamaModelManager(config)
+    
+    os.makedirs(EVIDENCE_DIR, exist_ok=True)
+    _view_cache = open_cache(config, 'views')
+    _task_pool = ThreadPoolExecutor(max_workers=config.BACKGROUND_TASK_WORKERS, thread_name_prefix='sift-task')
+    _llm_client = correlation_engine.llm_client
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+_tasks = OrderedDict()
+_tasks_lock = threading.Lock()
+_llm_status_cache = {'ts': 0.0, 'value': None}
+_llm_status_lock = threading.Lock()
 
 
 def _parse_request_datetime(value, default=None):
@@ -35,24 +91,134 @@ def _parse_request_datetime(value, default=None):
     return parse_date(value)
 
 
-def _geocode_location(location):
-    if not location:
-        return None
+class _EvidenceFileTarget(BaseTarget):
+    def __init__(self):
+        super().__init__()
+        self.filename = None
+        self.path = None
+        self._fd = None
+
+    def on_start(self):
+        self.filename = secure_filename(self.multipart_filename or '')
+        if not self.filename:
+            return
+
+        self.path = os.path.join(EVIDENCE_DIR, self.filename)
+        self._fd = open(self.path, 'wb')
+
+    def on_data_received(self, chunk):
+        if self._fd:
+            self._fd.write(chunk)
+
+    def on_finish(self):
+        if self._fd:
+            self._fd.close()
+            self._fd = None
+
+
+def _receive_evidence_upload():
+    content_type = request.headers.get('Content-Type', '')
+    if not content_type.startswith('multipart/form-data'):
+        raise ValueError('Expected a multipart/form-data upload')
+
+    files_target = MultipleTargets(_EvidenceFileTarget)
+    timezone_target = ValueTarget()
 
     try:
-        from geopy.geocoders import Nominatim
-
-        geolocator = Nominatim(user_agent=config.REDDIT_USER_AGENT)
-        location_obj = geolocator.geocode(location)
-        if location_obj:
-            return {
-                'lat': location_obj.latitude,
-                'lon': location_obj.longitude,
-            }
+        parser = StreamingFormDataParser(headers={'Content-Type': content_type})
+        parser.register('evidence_files', files_target)
+        parser.register('timezone', timezone_target)
+
+        while True:
+            chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.data_received(chunk)
     except Exception as e:
-        logger.warning(f"Could not geocode location '{location}': {e}")
+        # drop partially written evidence so a broken upload leaves nothing behind
+        for target in files_target.targets:
+            target.on_finish()
+            if target.path and os.path.exists(target.path):
+                os.remove(target.path)
+        raise ValueError(f'Malformed upload: {e}') from e
+
+    saved_files = [(target.filename, target.path) for target in files_target.targets if target.path]
+    timezone = timezone_target.value.decode('utf-8') or 'UTC'
+
+    return saved_files, timezone
+
+
+def _get_parse_pool():
+    global _parse_pool
+    
+    # spawned rather than forked: request threads, logging and sqlite locks must not leak into workers
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=config.FORENSIC_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _parse_pool
+
+
+def _shutdown_pools():
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+    _task_pool.shutdown(wait=False, cancel_futures=True)
+
+
+if not _IS_PARSE_WORKER:
+    atexit.register(_shutdown_pools)
+
+
+def _submit_task(fn, *args):
+    task_id = uuid.uuid4().hex
+    future = _task_pool.submit(fn, *args)
+
+    with _tasks_lock:
+        _tasks[task_id] = future
+        for stale_id in [tid for tid, f in _tasks.items() if f.done()][:max(0, len(_tasks) - MAX_TRACKED_TASKS)]:
+            del _tasks[stale_id]
+
+    return task_id
+
+
+def _cached_view(key, build):
+    if _view_cache is not None:
+        try:
+            cached = _view_cache.get(key)
+            if cached is not None:
+                return cached
+        except Exception as e:
+            logger.warning(f"View cache read failed for '{key}': {e}")
 
-    return None
+    value = build()
+
+    if _view_cache is not None:
+        try:
+            _view_cache.set(key, value, expire=config.VIEW_CACHE_TTL_HOURS * 3600)
+        except Exception as e:
+            logger.warning(f"View cache write failed for '{key}': {e}")
+
+    return value
+
+
+def _geocode_location(location):
+    location_data = osint_collector.geocode_location(location)
+    if not location_data:
+        return None
+
+    return {
+        'lat': location_data['lat'],
+        'lon': location_data['lon'],
+    }
+
+
+@app.teardown_appcontext
+def _close_read_connection(exc):
+    # the threaded server uses a fresh thread per request, each would otherwise keep its sqlite handle
+    db_manager.close_read_connection()
 
 @app.route('/')
 def index():
@@ -84,8 +250,7 @@ def investigation_detail(investigation_id):
     if not investigation:
         return "Investigation not found", 404
     
-    stats = db_manager.get_investigation_statistics(investigation_id)
-    correlations = db_manager.get_correlations(investigation_id, min_strength=0.5, limit=10)
+    stats, correlations = db_manager.get_detail_bundle(investigation_id, min_strength=0.5, limit=10)
     
     return render_template('investigation_detail.html', 
                          investigation=investigation, 
@@ -95,27 +260,23 @@ def investigation_detail(investigation_id):
 @app.route('/investigation/<int:investigation_id>/upload_evidence', methods=['POST'])
 def upload_evidence(investigation_id):
     try:
-        files = request.files.getlist('evidence_files')
-        if not files or all(f.filename == '' for f in files):
+        saved_files, timezone = _receive_evidence_upload()
+        if not saved_files:
             return jsonify({'error': 'No files selected'}), 400
         
-        timezone = request.form.get('timezone', 'UTC')
         total_events = 0
         processed_files = []
         errors = []
         
-        for file in files:
-            if file.filename == '':
-                continue
-                
+        futures = {}
+        for filename, upload_path in saved_files:
+            logger.info(f"Processing evidence file: {upload_path}")
+            futures[_get_parse_pool().submit(parse_evidence_file, upload_path, timezone)] = filename
+        
+        for future in as_completed(futures):
+            filename = futures[future]
             try:
-                filename = secure_filename(file.filename)
-                upload_path = os.path.join('evidence', filename)
-                os.makedirs(os.path.dirname(upload_path), exist_ok=True)
-                file.save(upload_path)
-                
-                logger.info(f"Processing evidence file: {upload_path}")
-                forensic_events = forensic_analyzer.parse_evidence_file(upload_path, timezone)
+                forensic_events = future.result()
                 
                 if forensic_events:
                     db_manager.save_forensic_events(investigation_id, forensic_events)
@@ -160,6 +321,9 @@ def upload_evidence(investigation_id):
                 error_msg += f'. Errors: {"; ".join(errors)}'
             return jsonify({'error': error_msg}), 400
             
+    except ValueError as e:
+        logger.error(f"Rejected evidence upload: {e}")
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error processing evidence: {e}")
         return jsonify({'error': str(e)}), 500
@@ -259,31 +423,27 @@ def timeline_view(investigation_id):
     if not investigation:
         return "Investigation not found", 404
     
-    forensic_events = db_manager.get_forensic_events(investigation_id, limit=1000)
-    osint_data = db_manager.get_osint_data(investigation_id, limit=1000)
     correlations = db_manager.get_correlations(investigation_id, min_strength=0.3)
     
     timeline_data = []
     
-    for event in forensic_events:
-        timeline_data.append({
-            'timestamp': event['timestamp'],
-            'type': 'forensic',
-            'title': f"{event['event_type']} - {os.path.basename(event['file_path'])}",
-            'description': event['file_path'],
-            'data': event
-        })
-    
-    for item in osint_data:
-        timeline_data.append({
-            'timestamp': item['timestamp'],
-            'type': 'osint',
-            'title': f"{item['source']} - {item.get('author', 'Unknown')}",
-            'description': item['content'][:100] + '...',
-            'data': item
-        })
-    
-    timeline_data.sort(key=lambda x: x['timestamp'])
+    for row in db_manager.get_timeline(investigation_id, limit=1000):
+        if row['kind'] == 'forensic':
+            timeline_data.append({
+                'timestamp': row['timestamp'],
+                'type': 'forensic',
+                'title': f"{row['event_type']} - {os.path.basename(row['file_path'])}",
+                'description': row['file_path'],
+                'data': row
+            })
+        else:
+            timeline_data.append({
+                'timestamp': row['timestamp'],
+                'type': 'osint',
+                'title': f"{row['source']} - {row['author'] or 'Unknown'}",
+                'description': row['content'][:100] + '...',
+                'data': row
+            })
     
     return render_template('timeline.html', 
                          investigation=investigation,
@@ -296,44 +456,49 @@ def map_view(investigation_id):
     if not investigation:
         return "Investigation not found", 404
     
+    version = db_manager.get_data_version(investigation_id)
+    key = f"map:{investigation_id}:{version['osint_data']}:{investigation['location']}"
+    map_html = _cached_view(key, lambda: _render_osint_map(investigation_id, investigation['location']))
+    
+    return render_template('map.html',
+                         investigation=investigation,
+                         map_html=map_html)
+
+def _render_osint_map(investigation_id, location):
+    import folium
+    from folium.plugins import FastMarkerCluster
+    
     osint_data = db_manager.get_osint_data(investigation_id)
     
     center_lat, center_lon = 39.8283, -98.5795
-    location_data = _geocode_location(investigation['location'])
+    location_data = _geocode_location(location)
     if location_data:
         center_lat, center_lon = location_data['lat'], location_data['lon']
     
     map_obj = folium.Map(location=[center_lat, center_lon], zoom_start=10)
     
-    for item in osint_data:
-        if item.get('coordinates'):
-            coords = item['coordinates']
-            popup_content = f"""
+    points = [
+        [
+            coords['lat'],
+            coords['lon'],
+            f"""
             <b>{item['source']}</b><br>
             <b>Author:</b> {item.get('author', 'Unknown')}<br>
             <b>Time:</b> {item['timestamp']}<br>
             <b>Content:</b> {item['content'][:200]}...<br>
             <a href="{item.get('url', '#')}" target="_blank">View Original</a>
-            """
-            
-            color = {
-                'twitter': 'blue',
-                'reddit': 'orange', 
-                'news_api': 'green',
-                'google_news': 'red'
-            }.get(item['source'], 'gray')
-            
-            folium.Marker(
-                [coords['lat'], coords['lon']],
-                popup=folium.Popup(popup_content, max_width=300),
-                icon=folium.Icon(color=color)
-            ).add_to(map_obj)
+            """,
+            OSINT_MARKER_COLORS.get(item['source'], 'gray')
+        ]
+        for item in osint_data
+        if (coords := item.get('coordinates'))
+    ]
     
-    map_html = map_obj._repr_html_()
+    if points:
+        FastMarkerCluster(points, callback=OSINT_MARKER_CALLBACK).add_to(map_obj)
     
-    return render_template('map.html',
-                         investigation=investigation,
-                         map_html=map_html)
+    return map_obj._repr_html_()
+
 
 @app.route('/investigation/<int:investigation_id>/analytics')
 def analytics_view(investigation_id):
@@ -341,84 +506,125 @@ def analytics_view(investigation_id):
     if not investigation:
         return "Investigation not found", 404
     
-    forensic_events = db_manager.get_forensic_events(investigation_id)
-    osint_data = db_manager.get_osint_data(investigation_id)
-    correlations = db_manager.get_correlations(investigation_id)
-    
-    forensic_timeline = _create_forensic_timeline_chart(forensic_events)
-    osint_sources_chart = _create_osint_sources_chart(osint_data)
-    correlation_strength_chart = _create_correlation_strength_chart(correlations)
+    version = db_manager.get_data_version(investigation_id)
+    key = f"analytics:{investigation_id}:{version['forensic_events']}:{version['osint_data']}:{version['correlations']}"
+    charts = _cached_view(key, lambda: _build_analytics_charts(investigation_id))
     
     return render_template('analytics.html',
                          investigation=investigation,
-                         forensic_timeline=forensic_timeline,
-                         osint_sources_chart=osint_sources_chart,
-                         correlation_strength_chart=correlation_strength_chart)
+                         **charts)
 
-def _create_forensic_timeline_chart(events):
-    if not events:
-        return json.dumps({})
+def _build_analytics_charts(investigation_id):
+    daily_counts = db_manager.get_forensic_event_counts_by_day(investigation_id)
+    osint_data = db_manager.get_osint_data(investigation_id)
+    correlations = db_manager.get_correlations(investigation_id)
     
-    event_counts = {}
-    for event in events:
-        date = event['timestamp'].split('T')[0] if isinstance(event['timestamp'], str) else event['timestamp'].date()
-        event_counts[str(date)] = event_counts.get(str(date), 0) + 1
+    return {
+        'forensic_timeline': _create_forensic_timeline_chart(daily_counts),
+        'osint_sources_chart': _create_osint_sources_chart(osint_data),
+        'correlation_strength_chart': _create_correlation_strength_chart(correlations),
+    }
+
+def _np_default(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _fast_plotly_json(fig):
+    return orjson.dumps(fig.to_plotly_json(), default=_np_default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+def _create_forensic_timeline_chart(daily_counts):
+    import plotly.graph_objs as go
+    
+    if not daily_counts:
+        return json.dumps({})
     
-    dates = sorted(event_counts.keys())
-    counts = [event_counts[date] for date in dates]
+    dates = []
+    counts = []
+    for day, count in daily_counts:
+        dates.append(day)
+        counts.append(count)
     
     fig = go.Figure(data=go.Scatter(x=dates, y=counts, mode='lines+markers'))
     fig.update_layout(title='Forensic Events Timeline', xaxis_title='Date', yaxis_title='Event Count')
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return _fast_plotly_json(fig)
 
 def _create_osint_sources_chart(osint_data):
+    import plotly.graph_objs as go
+    
     if not osint_data:
         return json.dumps({})
     
-    source_counts = {}
-    for item in osint_data:
-        source = item['source']
-        source_counts[source] = source_counts.get(source, 0) + 1
+    source_counts = Counter(item['source'] for item in osint_data)
     
     fig = go.Figure(data=go.Pie(labels=list(source_counts.keys()), values=list(source_counts.values())))
     fig.update_layout(title='OSINT Data Sources')
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return _fast_plotly_json(fig)
 
 def _create_correlation_strength_chart(correlations):
+    import plotly.graph_objs as go
+    
     if not correlations:
         return json.dumps({})
     
-    strengths = [corr['correlation_strength'] for corr in correlations]
+    strengths = np.fromiter(
+        (corr['correlation_strength'] for corr in correlations),
+        dtype=np.float32,
+        count=len(correlations)
+    )
+    counts, edges = np.histogram(strengths, bins=20, range=(0.0, 1.0))
     
-    fig = go.Figure(data=go.Histogram(x=strengths, nbinsx=20))
+    fig = go.Figure(data=go.Bar(x=((edges[:-1] + edges[1:]) / 2).tolist(), y=counts.tolist(), width=float(edges[1] - edges[0])))
     fig.update_layout(title='Correlation Strength Distribution', xaxis_title='Strength', yaxis_title='Count')
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return _fast_plotly_json(fig)
 
 @app.route('/api/investigation/<int:investigation_id>/export')
 def export_investigation(investigation_id):
     try:
         investigation = db_manager.get_investigation(investigation_id)
-        forensic_events = db_manager.get_forensic_events(investigation_id)
-        osint_data = db_manager.get_osint_data(investigation_id)
-        correlations = db_manager.get_correlations(investigation_id)
-        
-        export_data = {
-            'investigation': investigation,
-            'forensic_events': forensic_events,
-            'osint_data': osint_data,
-            'correlations': correlations,
-            'export_timestamp': datetime.now().isoformat()
-        }
+        if not investigation:
+            return jsonify({'error': 'Investigation not found'}), 404
         
-        return jsonify(export_data)
+        def generate():
+            try:
+                yield _ndjson_line('investigation', investigation)
+                
+                for event in db_manager.iter_forensic_events(investigation_id):
+                    yield _ndjson_line('forensic_event', event)
+                
+                for item in db_manager.iter_osint_data(investigation_id):
+                    yield _ndjson_line('osint_data', item)
+                
+                for correlation in db_manager.iter_correlations(investigation_id):
+                    yield _ndjson_line('correlation', correlation)
+                
+                yield _ndjson_line('export_timestamp', datetime.now().isoformat())
+            finally:
+                # the client may drop the download midway, don't leave the cursor's connection open
+                db_manager.close_read_connection()
+        
+        return Response(
+            stream_with_context(generate()),
+            mimetype='application/x-ndjson',
+            headers={'Content-Disposition': f'attachment; filename=investigation_{investigation_id}.ndjson'}
+        )
         
     except Exception as e:
         logger.error(f"Error exporting investigation: {e}")
         return jsonify({'error': str(e)}), 500
 
+def _ndjson_line(section, row):
+    return orjson.dumps(
+        {'section': section, 'row': row},
+        default=str,
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    )
+
 @app.route('/investigation/<int:investigation_id>/llm_analysis', methods=['POST'])
 def run_llm_analysis(investigation_id):
     try:
@@ -445,14 +651,16 @@ def run_llm_analysis(investigation_id):
             llm_insights = correlation_engine.analyze_correlation_patterns_with_llm(correlations)
         
         web_trends = None
-        if any(item.get('source') == 'web_intelligence' for item in osint_data):
+        search_queries = []
+        for item in osint_data:
+            if item.get('source') == 'web_intelligence':
+                search_queries.append(item.get('data', {}).get('search_query', ''))
+        
+        if search_queries and osint_collector.web_intelligence:
             try:
-                web_intel_items = [item for item in osint_data if item.get('source') == 'web_intelligence']
-                if osint_collector.web_intelligence:
-                    search_queries = [item.get('data', {}).get('search_query', '') for item in web_intel_items]
-                    web_trends = osint_collector.web_intelligence.analyze_web_trend(
-                        search_queries, investigation['location']
-                    )
+                web_trends = osint_collector.web_intelligence.analyze_web_trend(
+                    search_queries, investigation['location']
+                )
             except Exception as e:
                 logger.warning(f"Web trend analysis failed: {e}")
         
@@ -488,8 +696,26 @@ def run_full_investigation(investigation_id):
         data = request.json or {}
         context_notes = data.get('context_notes', '')
         
+        task_id = _submit_task(
+            _run_full_investigation_task, investigation_id, investigation, forensic_events, context_notes
+        )
+        
+        return jsonify({
+            'success': True,
+            'message': 'Full investigation started',
+            'task_id': task_id
+        }), 202
+        
+    except Exception as e:
+        logger.error(f"Error running full investigation: {e}")
+        return jsonify({'error': str(e)}), 500
+
+def _run_full_investigation_task(investigation_id, investigation, forensic_events, context_notes):
+    try:
         logger.info(f"Running full investigation for investigation {investigation_id}")
 
+        osint_data = db_manager.get_osint_data(investigation_id)
+
         if config.WEB_SEARCH_ENABLE and config.OLLAMA_ENABLE:
             try:
                 web_intel_data = osint_collector.collect_web_intelligence(
@@ -499,22 +725,22 @@ def run_full_investigation(investigation_id):
                     end_time=datetime.now(),
                     context_notes=context_notes
                 )
-                
+            
                 if web_intel_data:
                     db_manager.save_osint_data(investigation_id, web_intel_data)
+                    osint_data = osint_data + web_intel_data
                     logger.info(f"Collected {len(web_intel_data)} web intelligence items")
             except Exception as e:
                 logger.warning(f"Web intelligence collection failed: {e}")
 
-        osint_data = db_manager.get_osint_data(investigation_id)
         location_data = _geocode_location(investigation.get('location'))
-        
+    
         correlations = []
         if osint_data:
             correlations = correlation_engine.correlate_forensic_osint(
                 forensic_events, osint_data, location_data
             )
-            
+        
             if correlations:
                 db_manager.save_correlations(investigation_id, correlations)
                 logger.info(f"Found {len(correlations)} correlations")
@@ -529,7 +755,7 @@ def run_full_investigation(investigation_id):
                 llm_insights = None
                 if correlations:
                     llm_insights = correlation_engine.analyze_correlation_patterns_with_llm(correlations)
-                
+            
                 analysis_results = {
                     'investigation_summary': llm_summary,
                     'correlation_insights': llm_insights,
@@ -550,12 +776,29 @@ def run_full_investigation(investigation_id):
                 'analysis': analysis_results
             }
         }
-        
-        return jsonify(response_data)
+    
+        return response_data
         
     except Exception as e:
         logger.error(f"Error running full investigation: {e}")
-        return jsonify({'error': str(e)}), 500
+        raise
+
+@app.route('/api/task/<task_id>')
+def task_status(task_id):
+    with _tasks_lock:
+        future = _tasks.get(task_id)
+    
+    if future is None:
+        return jsonify({'error': 'Task not found'}), 404
+    
+    if not future.done():
+        return jsonify({'task_id': task_id, 'state': 'RUNNING' if future.running() else 'PENDING'})
+    
+    error = future.exception()
+    if error is not None:
+        return jsonify({'task_id': task_id, 'state': 'FAILURE', 'error': str(error)})
+    
+    return jsonify({'task_id': task_id, 'state': 'SUCCESS', 'result': future.result()})
 
 @app.route('/investigation/<int:investigation_id>/web_intelligence', methods=['POST'])
 def collect_web_intelligence(investigation_id):
@@ -602,17 +845,22 @@ def collect_web_intelligence(investigation_id):
 @app.route('/api/llm_status')
 def llm_status():
     try:
-        from llm_client import OllamaClient
-        
-        llm_client = OllamaClient(config)
-        status = {
-            'ollama_enabled': config.OLLAMA_ENABLE,
-            'ollama_host': config.OLLAMA_HOST,
-            'ollama_model': config.OLLAMA_MODEL,
-            'web_search_enabled': config.WEB_SEARCH_ENABLE,
-            'web_search_engine': config.WEB_SEARCH_ENGINE,
-            'llm_available': llm_client.is_available() if llm_client else False
-        }
+        with _llm_status_lock:
+            status = _llm_status_cache['value']
+            fresh = time.monotonic() - _llm_status_cache['ts'] < LLM_STATUS_TTL_SECONDS
+        
+        if not fresh:
+            status = {
+                'ollama_enabled': config.OLLAMA_ENABLE,
+                'ollama_host': config.OLLAMA_HOST,
+                'ollama_model': config.OLLAMA_MODEL,
+                'web_search_enabled': config.WEB_SEARCH_ENABLE,
+                'web_search_engine': config.WEB_SEARCH_ENGINE,
+                'llm_available': _llm_available()
+            }
+            with _llm_status_lock:
+                _llm_status_cache['value'] = status
+                _llm_status_cache['ts'] = time.monotonic()
         
         return jsonify(status)
         
@@ -620,6 +868,28 @@ def llm_status():
         logger.error(f"Error checking LLM status: {e}")
         return jsonify({'error': str(e)}), 500
 
+def _llm_available():
+    global _llm_client
+    
+    if not config.OLLAMA_ENABLE:
+        return False
+    
+    llm_client = _llm_client
+    if llm_client is None or not llm_client.is_available():
+        from llm_client import OllamaClient
+        
+        llm_client = OllamaClient(config)
+        _llm_client = llm_client
+        return llm_client.is_available()
+    
+    # is_available only reflects the last init, so ask the server itself
+    try:
+        llm_client.client.list()
+        return True
+    except Exception as e:
+        logger.debug(f"Ollama not reachable: {e}")
+        return False
+
 @app.route('/models')
 def models_page():
     model_status = ollama_manager.get_model_status()